@@ -6,24 +6,39 @@ This script reads evaluation results and quality gate configuration,
 then determines if scores meet the minimum thresholds.
 
 Usage:
-    python check_evaluation_scores.py <results_file> [--config <config_file>]
+    python check_evaluation_scores.py <results_file> [--config <config_file>] [--verbose]
 
 Environment variables:
     RESULTS_FILE: Path to evaluation results JSONL file
     CONFIG_FILE: Path to evaluation configuration JSON file (optional)
 """
 
+import argparse
 import json
+import mmap
 import os
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _loads = json.loads
+
+_DETAILS_LINE = "  {}: {} samples, avg={:.2f}"
+_SET_OUTPUT_LINE = "::set-output name={}::{}"
+# Multiline values (the summary message) need the heredoc form in $GITHUB_OUTPUT
+_OUTPUT_DELIMITER = "EOF_EVALUATION_SCORES"
+_OUTPUT_ENTRY = "{0}<<{2}\n{1}\n{2}\n"
+
 
 def load_config(config_path: str = ".github/evaluation-config.json") -> dict:
     """Load evaluation configuration from JSON file."""
     try:
-        with open(config_path) as f:
-            return json.load(f)
+        return _loads(Path(config_path).read_bytes())
     except FileNotFoundError:
         print(f"❌ Config file not found: {config_path}")
         sys.exit(1)
@@ -32,6 +47,18 @@ def load_config(config_path: str = ".github/evaluation-config.json") -> dict:
         sys.exit(1)
 
 
+def iter_records(results_path: str) -> Iterator[dict]:
+    """Yield decoded records from a JSONL file, scanning lines over a read-only mmap."""
+    with open(results_path, "rb") as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield _loads(line)
+
+
 def load_results(results_path: str) -> list[dict]:
     """Load evaluation results from JSONL file."""
     if not Path(results_path).exists():
@@ -40,107 +67,136 @@ def load_results(results_path: str) -> list[dict]:
 
     results = []
     try:
-        with open(results_path) as f:
-            for line in f:
-                if line.strip():
-                    results.append(json.loads(line))
+        # Append one record at a time so a malformed line keeps everything parsed before it
+        for record in iter_records(results_path):
+            results.append(record)
     except json.JSONDecodeError as e:
         print(f"⚠️ Error parsing results file: {e}")
 
     return results
 
 
-def extract_scores(results: list[dict]) -> dict:
-    """Extract evaluation scores from results."""
-    groundedness_scores = []
-    relevance_scores = []
+def _accumulate_scores(records: Iterable[dict]) -> tuple[dict, int]:
+    """Fold records into per-metric running (sum, count) means, returning the scores and record count."""
+    g_sum = r_sum = 0.0
+    g_count = r_count = records_seen = 0
+    # Bound once: the loop runs per record and is pure interpreter work after JSON decoding
+    to_float = float
+    skipped = (ValueError, TypeError)
 
-    for result in results:
-        if "groundedness_score" in result:
+    for record in records:
+        records_seen += 1
+        get = record.get
+        g = get("groundedness_score")
+        if g is not None:
             try:
-                groundedness_scores.append(float(result["groundedness_score"]))
-            except (ValueError, TypeError):
+                g_sum += to_float(g)
+                g_count += 1
+            except skipped:
                 pass
-
-        if "relevance_score" in result:
+        r = get("relevance_score")
+        if r is not None:
             try:
-                relevance_scores.append(float(result["relevance_score"]))
-            except (ValueError, TypeError):
+                r_sum += to_float(r)
+                r_count += 1
+            except skipped:
                 pass
 
-    return {
-        "groundedness": {
-            "scores": groundedness_scores,
-            "average": sum(groundedness_scores) / len(groundedness_scores) if groundedness_scores else 0.0,
-            "count": len(groundedness_scores),
-        },
-        "relevance": {
-            "scores": relevance_scores,
-            "average": sum(relevance_scores) / len(relevance_scores) if relevance_scores else 0.0,
-            "count": len(relevance_scores),
-        },
+    scores = {
+        "groundedness": {"average": g_sum / g_count if g_count else 0.0, "count": g_count},
+        "relevance": {"average": r_sum / r_count if r_count else 0.0, "count": r_count},
     }
+    return scores, records_seen
+
+
+def extract_scores(results: list[dict]) -> dict:
+    """Extract evaluation scores from results."""
+    scores, _ = _accumulate_scores(results)
+    return scores
 
 
-def check_thresholds(scores: dict, config: dict) -> tuple[bool, str]:
+def stream_scores(results_path: str) -> dict:
+    """
+    Aggregate evaluation scores in a single pass over the results file.
+
+    Keeps a running (sum, count) per metric instead of materializing the records,
+    so memory stays flat regardless of the size of the results dump.
+
+    Returns:
+        Per-metric ``average``/``count`` dicts plus ``records``, the number of
+        records read (0 when the file is missing or empty).
+    """
+    scores, records = _accumulate_scores(_iter_valid_records(results_path))
+    return {"records": records, **scores}
+
+
+def _iter_valid_records(results_path: str) -> Iterator[dict]:
+    """Yield records until the end of the file or the first malformed line."""
+    if not Path(results_path).exists():
+        print(f"⚠️ Results file not found: {results_path}")
+        return
+
+    try:
+        yield from iter_records(results_path)
+    except json.JSONDecodeError as e:
+        print(f"⚠️ Error parsing results file: {e}")
+
+
+def check_thresholds(scores: dict, config: dict) -> tuple[bool, dict]:
     """
     Check if scores meet configured thresholds.
 
     Returns:
-        (passed: bool, message: str)
+        (passed: bool, report: dict) where report holds the aggregation strategy,
+        per-metric results and, when no metric was evaluated, a ``note``
     """
     quality_gates = config.get("evaluation", {}).get("quality_gates", {})
+    aggregation = quality_gates.get("aggregation", "average").lower()
+    report = {"aggregation": aggregation, "metrics": {}}
 
     if not quality_gates.get("enabled", True):
-        return True, "Quality gates disabled"
+        report["note"] = "Quality gates disabled"
+        return True, report
 
     metrics = quality_gates.get("metrics", {})
-    aggregation = quality_gates.get("aggregation", "average").lower()
-
-    results = {}
-
-    # Check groundedness
-    if metrics.get("groundedness", {}).get("enabled", True):
-        min_score = metrics["groundedness"].get("min_score", 0.5)
-        avg_score = scores["groundedness"]["average"]
-        passed = avg_score >= min_score
-        results["groundedness"] = {
-            "passed": passed,
-            "average": round(avg_score, 2),
-            "threshold": min_score,
-            "count": scores["groundedness"]["count"],
-        }
-
-    # Check relevance
-    if metrics.get("relevance", {}).get("enabled", True):
-        min_score = metrics["relevance"].get("min_score", 0.5)
-        avg_score = scores["relevance"]["average"]
-        passed = avg_score >= min_score
-        results["relevance"] = {
-            "passed": passed,
+    results = report["metrics"]
+
+    for metric_name in ("groundedness", "relevance"):
+        metric_config = metrics.get(metric_name, {})
+        if not metric_config.get("enabled", True):
+            continue
+        min_score = metric_config.get("min_score", 0.5)
+        avg_score = scores[metric_name]["average"]
+        results[metric_name] = {
+            "passed": avg_score >= min_score,
             "average": round(avg_score, 2),
             "threshold": min_score,
-            "count": scores["relevance"]["count"],
+            "count": scores[metric_name]["count"],
         }
 
     # Determine overall pass/fail based on aggregation strategy
     if not results:
-        return True, "No metrics to evaluate"
+        report["note"] = "No metrics to evaluate"
+        return True, report
 
     metric_passes = [r["passed"] for r in results.values()]
 
     if aggregation == "any":
         overall_passed = any(metric_passes)
-    elif aggregation == "all":
-        overall_passed = all(metric_passes)
-    else:  # average (default)
+    else:  # "all" and "average" (default)
         overall_passed = all(metric_passes)
 
-    # Generate message
-    message_lines = ["📊 Evaluation Quality Gates Results:"]
-    message_lines.append("")
+    return overall_passed, report
+
+
+def format_message(passed: bool, report: dict) -> str:
+    """Render a threshold report from ``check_thresholds`` as a human-readable summary."""
+    if "note" in report:
+        return report["note"]
+
+    message_lines = ["📊 Evaluation Quality Gates Results:", ""]
 
-    for metric_name, result in results.items():
+    for metric_name, result in report["metrics"].items():
         status = "✅" if result["passed"] else "❌"
         message_lines.append(
             f"{status} {metric_name.upper()}: {result['average']} "
@@ -148,56 +204,85 @@ def check_thresholds(scores: dict, config: dict) -> tuple[bool, str]:
         )
 
     message_lines.append("")
-    message_lines.append(f"Aggregation strategy: {aggregation}")
+    message_lines.append(f"Aggregation strategy: {report['aggregation']}")
+    message_lines.append(status_line(passed, report))
 
-    if overall_passed:
-        message_lines.append("✅ All quality gates passed!")
-    else:
-        message_lines.append("❌ Quality gates failed - some metrics below threshold")
+    return "\n".join(message_lines)
 
-    return overall_passed, "\n".join(message_lines)
 
+def status_line(passed: bool, report: dict) -> str:
+    """One-line overall result, published as the step's message output."""
+    if "note" in report:
+        return report["note"]
+    return "✅ All quality gates passed!" if passed else "❌ Quality gates failed - some metrics below threshold"
 
-def main():
-    """Main entry point."""
-    # Parse arguments
-    results_file = None
-    config_file = ".github/evaluation-config.json"
 
-    for i, arg in enumerate(sys.argv[1:]):
-        if arg == "--config" and i + 1 < len(sys.argv) - 1:
-            config_file = sys.argv[i + 2]
-        elif not arg.startswith("--"):
-            results_file = arg
+def write_github_outputs(outputs: dict[str, str], out: list[str]) -> None:
+    """
+    Publish step outputs for GitHub Actions.
+
+    Appends to the ``$GITHUB_OUTPUT`` file when running under Actions, otherwise
+    falls back to the legacy ``::set-output`` workflow commands collected in ``out``.
+    """
+    output_file = os.environ.get("GITHUB_OUTPUT")
+    if output_file:
+        with open(output_file, "a", encoding="utf-8") as f:
+            f.write("".join(_OUTPUT_ENTRY.format(name, value, _OUTPUT_DELIMITER) for name, value in outputs.items()))
+    else:
+        out.extend(_SET_OUTPUT_LINE.format(name, value) for name, value in outputs.items())
 
-    # Try environment variable if not provided as argument
-    if not results_file:
-        results_file = os.environ.get("RESULTS_FILE", "data/evaluation_results.jsonl")
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Check evaluation scores against configured thresholds.")
+    parser.add_argument(
+        "results_file",
+        nargs="?",
+        default=os.environ.get("RESULTS_FILE", "data/evaluation_results.jsonl"),
+        help="Path to evaluation results JSONL file",
+    )
+    parser.add_argument(
+        "--config",
+        dest="config_file",
+        default=os.environ.get("CONFIG_FILE", ".github/evaluation-config.json"),
+        help="Path to evaluation configuration JSON file",
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also publish the full per-metric report as the step's message output",
+    )
+    args = parser.parse_args()
+    results_file = args.results_file
+    config_file = args.config_file
 
     # Load config and results
     config = load_config(config_file)
-    results = load_results(results_file)
+    scores = stream_scores(results_file)
 
-    if not results:
-        print("⚠️ No evaluation results found")
-        print("::set-output name=passed::false")
-        print("::set-output name=message::No evaluation results available")
+    if not scores["records"]:
+        out = ["⚠️ No evaluation results found"]
+        write_github_outputs({"passed": "false", "message": "No evaluation results available"}, out)
+        sys.stdout.write("\n".join(out) + "\n")
         sys.exit(0)
 
-    # Extract and check scores
-    scores = extract_scores(results)
-    passed, message = check_thresholds(scores, config)
-
-    # Print results
-    print(message)
-    print("")
-    print("Details:")
-    print(f"  Groundedness: {scores['groundedness']['count']} samples, avg={scores['groundedness']['average']:.2f}")
-    print(f"  Relevance: {scores['relevance']['count']} samples, avg={scores['relevance']['average']:.2f}")
-
-    # Set GitHub output
-    print(f"::set-output name=passed::{str(passed).lower()}")
-    print(f"::set-output name=message::{message}")
+    # Check scores
+    passed, report = check_thresholds(scores, config)
+    # The log always carries the full report; the step output stays one line unless asked
+    report_text = format_message(passed, report)
+    message = report_text if args.verbose else status_line(passed, report)
+
+    # Collect results and emit them in a single write
+    out = [
+        report_text,
+        "",
+        "Details:",
+        _DETAILS_LINE.format("Groundedness", scores["groundedness"]["count"], scores["groundedness"]["average"]),
+        _DETAILS_LINE.format("Relevance", scores["relevance"]["count"], scores["relevance"]["average"]),
+    ]
+    write_github_outputs({"passed": str(passed).lower(), "message": message}, out)
+    sys.stdout.write("\n".join(out) + "\n")
 
     # Exit with appropriate code
     sys.exit(0 if passed else 1)
@@ -1,16 +1,26 @@
 """Microsoft Agent Framework - Multi-agent AI orchestration."""
 
-from microsoft_agent_framework.observability import setup_observability
+from typing import TYPE_CHECKING, Any
 
-from .config import settings
-
-# Initialize observability/tracing for all agents
-# Configuration is loaded from environment variables via settings
-if settings.observability.enable_otel:
-    setup_observability(
-        enable_sensitive_data=settings.observability.enable_sensitive_data,
-        otlp_endpoint=settings.observability.otlp_endpoint,
-        applicationinsights_connection_string=settings.observability.applicationinsights_connection_string,
-    )
+if TYPE_CHECKING:
+    from .config import settings
+    from .observability import setup_observability
 
 __all__ = ["setup_observability", "settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public attributes on first access so importing the package stays cheap.
+
+    Observability is no longer initialized at import time; agents call
+    ``ensure_observability()`` when they are first initialized.
+    """
+    if name == "setup_observability":
+        from .observability import setup_observability
+
+        return setup_observability
+    if name == "settings":
+        from .config import settings
+
+        return settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+"""Console entry point for the Microsoft Agent Framework CLI.
+
+Top-level help and version requests are answered here without importing Typer,
+Rich or the application stack; everything else is handed to the Typer app.
+"""
+
+import sys
+
+PROG = "microsoft_agent_framework"
+
+# (command, summary) pairs shown by the fast help; must match the commands in cli.py
+COMMANDS = (
+    ("info", "Display framework information."),
+    ("list-agents", "List available agent types."),
+    ("chat", "Chat with an agent (automatically manages conversation threads)."),
+    ("serve", "Start the FastAPI server."),
+    ("config", "Display current configuration."),
+    ("validate", "Validate configuration and dependencies."),
+    ("chat-with-thread", "Chat with an agent using persisted conversation threads."),
+    ("list-threads", "List conversation threads."),
+    ("show-thread", "Show details of a conversation thread."),
+    ("delete-thread", "Delete a conversation thread."),
+    ("session", "Show current conversation sessions."),
+    ("clear-session", "Clear conversation sessions."),
+    ("recent", "Show recent conversations."),
+)
+
+_HELP_FLAGS = frozenset({"-h", "--help"})
+
+
+def format_usage() -> str:
+    """Build the top-level help text."""
+    width = max(len(name) for name, _ in COMMANDS)
+    lines = [
+        f"Usage: {PROG} [OPTIONS] COMMAND [ARGS]...",
+        "",
+        "Microsoft Agent Framework CLI - Multi-agent AI orchestration",
+        "",
+        "Options:",
+        f"  {'--version':<{width}}  Show the version and exit.",
+        f"  {'--help':<{width}}  Show this message and exit.",
+        "",
+        "Commands:",
+        *(f"  {name:<{width}}  {summary}" for name, summary in COMMANDS),
+    ]
+    return "\n".join(lines)
+
+
+def _version() -> str:
+    """Get the installed package version."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(PROG)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the CLI.
+
+    Args:
+        argv: Command-line arguments, excluding the program name (defaults to ``sys.argv[1:]``)
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    if not args or args[0] in _HELP_FLAGS:
+        print(format_usage())
+        return
+    if args[0] == "--version":
+        print(f"{PROG} {_version()}")
+        return
+
+    from microsoft_agent_framework.cli import create_app
+
+    # Only the invoked command needs to be turned into a Click command
+    app = create_app(args[0] if not args[0].startswith("-") else None)
+    app(args=args, prog_name=PROG)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Shared helpers for converting Azure agent responses into domain messages."""
+
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+from microsoft_agent_framework.config import settings
+from microsoft_agent_framework.domain.models import Message, MessageRole
+
+try:
+    from agent_framework import FunctionCallContent, FunctionResultContent
+
+    # Internal delegation details that should never surface as assistant output
+    _SKIP_TYPES: tuple[type, ...] = (FunctionCallContent, FunctionResultContent)
+except ImportError:  # pragma: no cover - depends on installed agent_framework version
+    _SKIP_TYPES = ()
+
+_ASSISTANT = MessageRole.ASSISTANT
+_MISSING = object()
+
+
+def convert_message(message: str | list[Message]) -> str:
+    """Convert an agent input into the plain text sent to Azure.
+
+    Args:
+        message: Raw text or a message history whose last entry is sent
+
+    Returns:
+        Text content, or an empty string for an empty history
+    """
+    # Exact type check first: plain str is by far the most common input
+    if message.__class__ is str or isinstance(message, str):
+        return message
+    if message:
+        return message[-1].content
+    return ""
+
+
+def _iter_response_texts(response_messages: Any) -> Iterator[str]:
+    """Yield the user-visible text of each content item, skipping function calls/results."""
+    for msg in response_messages:
+        contents = getattr(msg, "contents", None)
+        if not contents:
+            continue
+        for content in contents:
+            if isinstance(content, _SKIP_TYPES):
+                continue
+            text = getattr(content, "text", _MISSING)
+            if text is not _MISSING:
+                # TextContent - the actual response
+                if text:
+                    yield text
+            else:
+                # For other content types, try to convert to string
+                text_str = str(content)
+                if text_str and not text_str.startswith("<"):
+                    yield text_str
+
+
+def extract_text_messages(response: Any) -> list[Message]:
+    """Extract assistant messages from an Azure agent response.
+
+    Function call/result contents are skipped so only the actual replies are kept.
+
+    Args:
+        response: Response returned by the Azure agent's ``run`` method
+
+    Returns:
+        List of assistant messages, falling back to the response's string form
+    """
+    messages: list[Message] = []
+    # Loop-invariant lookups bound once; Message takes (role, content, timestamp) positionally.
+    # Every message in one response shares a single timestamp instead of reading the clock each
+    make = Message
+    role = _ASSISTANT
+    now = datetime.now(UTC)
+
+    try:
+        response_messages = getattr(response, "messages", None)
+        if response_messages:
+            # A single extend keeps the append loop inside list.extend; on failure the
+            # messages built so far are kept, followed by the string fallback
+            messages.extend(make(role, text, now) for text in _iter_response_texts(response_messages))
+        else:
+            messages.append(make(role, str(response), now))
+    except Exception:
+        messages.append(make(role, str(response), now))
+
+    return messages
+
+
+def response_metadata(response: Any) -> dict[str, Any]:
+    """Build lightweight metadata describing an Azure agent response.
+
+    The full ``str(response)`` walks the whole message tree, so it is only
+    included when ``INCLUDE_RAW_RESPONSE`` is enabled.
+
+    Args:
+        response: Response returned by the Azure agent's ``run`` method
+
+    Returns:
+        Metadata dict with the response id and, optionally, the raw response text
+    """
+    metadata: dict[str, Any] = {"response_id": getattr(response, "response_id", None)}
+    if settings.app.include_raw_response:
+        metadata["azure_response"] = str(response)
+    return metadata
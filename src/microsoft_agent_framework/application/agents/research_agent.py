@@ -6,8 +6,17 @@ from typing import Any
 
 from agent_framework import MCPStdioTool
 from agent_framework.azure import AzureAIAgentClient
-from azure.identity.aio import DefaultAzureCredential
+from azure.core.exceptions import ServiceRequestError, ServiceResponseError
 
+from microsoft_agent_framework.application.agents.message_utils import (
+    convert_message,
+    extract_text_messages,
+    response_metadata,
+)
+from microsoft_agent_framework.application.agents.thread_utils import (
+    new_native_thread,
+    remember_service_thread,
+)
 from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.exceptions import (
     AgentExecutionError,
@@ -32,6 +41,9 @@ from microsoft_agent_framework.domain.retry import (
     RetryStrategy,
     retry_async,
 )
+from microsoft_agent_framework.domain.utils import LRUCache
+from microsoft_agent_framework.infrastructure.llm_providers import get_project_client
+from microsoft_agent_framework.observability import ensure_observability
 
 logger = logging.getLogger(__name__)
 
@@ -43,22 +55,26 @@ class ResearchAgent(IAgent):
         self._config = config
         self._azure_agent = None
         self._is_initialized = False
-        self._native_threads: dict[str, Any] = {}  # Map thread_id to native Azure agent thread
+        # Map thread_id to native Azure agent thread, evicting the coldest conversations
+        self._native_threads: LRUCache[str, Any] = LRUCache(settings.resilience.thread_cache_size)
+        # Built per instance so agents created after settings.reload() use the new limits
         self._retry_policy = self._create_retry_policy()
         self._retry_callbacks = LoggingRetryCallbacks("research_agent")
 
-    def _create_retry_policy(self) -> RetryPolicy:
+    @staticmethod
+    def _create_retry_policy() -> RetryPolicy:
         """Create retry policy for research agent operations."""
         return RetryPolicy(
             max_attempts=settings.resilience.agent_max_attempts,
             base_delay=settings.resilience.agent_base_delay,
             max_delay=settings.resilience.agent_max_delay,
             strategy=RetryStrategy.EXPONENTIAL,
+            # Only transient failures; Azure transport errors are mapped to these in run().
+            # OSError also covers the builtin TimeoutError raised by asyncio timeouts
             retryable_exceptions={
                 ConnectionError,
                 TimeoutError,
                 OSError,
-                Exception,  # Catch-all for Azure SDK and network exceptions
             },
             non_retryable_exceptions={
                 AgentInitializationError,
@@ -82,6 +98,8 @@ class ResearchAgent(IAgent):
         if self._is_initialized:
             return
 
+        ensure_observability()
+
         try:
             # Validate Azure AI Foundry configuration
             if not settings.azure_ai_foundry.is_configured:
@@ -94,9 +112,8 @@ class ResearchAgent(IAgent):
 
             # Create Azure AI Foundry agent client
             client = AzureAIAgentClient(
-                project_endpoint=settings.azure_ai_foundry.project_endpoint,
+                project_client=get_project_client(settings.azure_ai_foundry.project_endpoint),
                 model_deployment_name=settings.azure_ai_foundry.model_deployment_name,
-                async_credential=DefaultAzureCredential(),
             )
 
             # Create the underlying Azure agent in Azure AI Foundry
@@ -113,6 +130,8 @@ class ResearchAgent(IAgent):
 
     async def cleanup(self) -> None:
         """Cleanup agent resources."""
+        # Native threads belong to the Azure agent being released
+        self._native_threads.clear()
         self._is_initialized = False
 
     async def run(
@@ -125,7 +144,7 @@ class ResearchAgent(IAgent):
         if not self._is_initialized:
             await self.initialize()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         async def _execute_research():
             """Inner function for research agent execution with retry support."""
@@ -136,11 +155,10 @@ class ResearchAgent(IAgent):
             native_thread = None
             if thread:
                 # Get existing native thread or create new one
-                if thread.thread_id in self._native_threads:
-                    native_thread = self._native_threads[thread.thread_id]
-                else:
-                    # Create new native thread from Azure agent
-                    native_thread = self._azure_agent.get_new_thread()
+                native_thread = self._native_threads.get(thread.thread_id)
+                if native_thread is None:
+                    # Create new native thread from Azure agent, resuming the conversation's service thread
+                    native_thread = new_native_thread(self._azure_agent, thread)
                     self._native_threads[thread.thread_id] = native_thread
 
                 # Add user message to custom thread for persistence
@@ -157,7 +175,9 @@ class ResearchAgent(IAgent):
             except Exception as e:
                 logger.error(f"Research agent execution failed: {e}")
                 # Re-raise with more specific error types for better retry handling
-                if "timeout" in str(e).lower():
+                if isinstance(e, (ServiceRequestError, ServiceResponseError)):
+                    raise ConnectionError(f"Research agent connection failed: {e}") from e
+                elif "timeout" in str(e).lower():
                     raise TimeoutError(f"Research agent execution timed out: {e}") from e
                 elif "connection" in str(e).lower() or "network" in str(e).lower():
                     raise ConnectionError(f"Research agent connection failed: {e}") from e
@@ -177,8 +197,9 @@ class ResearchAgent(IAgent):
             # Add assistant messages to custom thread for persistence
             if thread:
                 thread.add_messages(messages)
+                remember_service_thread(thread, self._native_threads.get(thread.thread_id))
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return AgentResponse(
                 agent_name=self.name,
@@ -186,14 +207,14 @@ class ResearchAgent(IAgent):
                 messages=messages,
                 execution_time=execution_time,
                 metadata={
-                    "azure_response": str(response),
+                    **response_metadata(response),
                     "thread_id": thread.thread_id if thread else None,
                     "retry_enabled": settings.resilience.enable_retries,
                 },
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"Research agent execution failed after retries: {e}")
 
             # Still raise the exception for proper error handling upstream
@@ -207,7 +228,8 @@ class ResearchAgent(IAgent):
         """Create tools for the research agent."""
         tools = []
 
-        # Add search tool if API key is available
+        # Add search tool if API key is available. Each agent gets its own tool: the agent
+        # that connects an MCP tool owns its stdio session and closes it on cleanup
         if settings.tools.brave_api_key:
             search_tool = MCPStdioTool(
                 name="brave_search",
@@ -221,44 +243,11 @@ class ResearchAgent(IAgent):
 
     def _convert_message(self, message: str | list[Message]) -> str:
         """Convert message to string format."""
-        if isinstance(message, str):
-            return message
-        elif isinstance(message, list) and message:
-            return message[-1].content
-        return ""
+        return convert_message(message)
 
     def _extract_messages(self, response: Any) -> list[Message]:
         """Extract messages from Azure agent response, filtering out internal delegation details."""
-        messages = []
-
-        try:
-            if hasattr(response, "messages") and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, "contents") and msg.contents:
-                        for content in msg.contents:
-                            # Skip FunctionCall and FunctionResult content (internal delegation details)
-                            # Only keep TextContent which contains actual responses
-                            content_type = type(content).__name__
-
-                            if "FunctionCall" in content_type or "FunctionResult" in content_type:
-                                # Skip internal delegation steps
-                                continue
-                            elif hasattr(content, "text"):
-                                # This is TextContent - the actual response
-                                text = content.text
-                                if text:
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text))
-                            else:
-                                # For other content types, try to convert to string
-                                text_str = str(content)
-                                if text_str and not text_str.startswith("<"):
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text_str))
-            else:
-                messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-        except Exception:
-            messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-
-        return messages
+        return extract_text_messages(response)
 
 
 def create_research_agent() -> ResearchAgent:
@@ -5,8 +5,16 @@ from typing import Annotated, Any
 
 from agent_framework import ai_function
 from agent_framework.azure import AzureAIAgentClient
-from azure.identity.aio import DefaultAzureCredential
 
+from microsoft_agent_framework.application.agents.message_utils import (
+    convert_message,
+    extract_text_messages,
+    response_metadata,
+)
+from microsoft_agent_framework.application.agents.thread_utils import (
+    new_native_thread,
+    remember_service_thread,
+)
 from microsoft_agent_framework.application.factories import agent_factory
 from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.exceptions import (
@@ -24,6 +32,9 @@ from microsoft_agent_framework.domain.models import (
     MessageRole,
 )
 from microsoft_agent_framework.domain.prompts.supervisor_prompt import SUPERVISOR_PROMPT
+from microsoft_agent_framework.domain.utils import LRUCache
+from microsoft_agent_framework.infrastructure.llm_providers import get_project_client
+from microsoft_agent_framework.observability import ensure_observability
 
 
 class SupervisorAgent(IAgent):
@@ -35,7 +46,8 @@ class SupervisorAgent(IAgent):
         self._research_agent = None
         self._writer_agent = None
         self._is_initialized = False
-        self._native_threads: dict[str, Any] = {}  # Map thread_id to native Azure agent thread
+        # Map thread_id to native Azure agent thread, evicting the coldest conversations
+        self._native_threads: LRUCache[str, Any] = LRUCache(settings.resilience.thread_cache_size)
 
     @property
     def name(self) -> str:
@@ -52,6 +64,8 @@ class SupervisorAgent(IAgent):
         if self._is_initialized:
             return
 
+        ensure_observability()
+
         try:
             # Validate Azure AI Foundry configuration
             if not settings.azure_ai_foundry.is_configured:
@@ -67,9 +81,8 @@ class SupervisorAgent(IAgent):
 
             # Create Azure AI Foundry agent client
             client = AzureAIAgentClient(
-                project_endpoint=settings.azure_ai_foundry.project_endpoint,
+                project_client=get_project_client(settings.azure_ai_foundry.project_endpoint),
                 model_deployment_name=settings.azure_ai_foundry.model_deployment_name,
-                async_credential=DefaultAzureCredential(),
             )
 
             # Create delegation functions
@@ -99,6 +112,8 @@ class SupervisorAgent(IAgent):
             await self._research_agent.cleanup()
         if self._writer_agent:
             await self._writer_agent.cleanup()
+        # Native threads belong to the Azure agent being released
+        self._native_threads.clear()
         self._is_initialized = False
 
     async def run(
@@ -111,7 +126,7 @@ class SupervisorAgent(IAgent):
         if not self._is_initialized:
             await self.initialize()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Convert message format
@@ -121,11 +136,10 @@ class SupervisorAgent(IAgent):
             native_thread = None
             if thread:
                 # Get existing native thread or create new one
-                if thread.thread_id in self._native_threads:
-                    native_thread = self._native_threads[thread.thread_id]
-                else:
-                    # Create new native thread from Azure agent
-                    native_thread = self._azure_agent.get_new_thread()
+                native_thread = self._native_threads.get(thread.thread_id)
+                if native_thread is None:
+                    # Create new native thread from Azure agent, resuming the conversation's service thread
+                    native_thread = new_native_thread(self._azure_agent, thread)
                     self._native_threads[thread.thread_id] = native_thread
 
                 # Add user message to custom thread for persistence
@@ -144,8 +158,9 @@ class SupervisorAgent(IAgent):
             # Add assistant messages to custom thread for persistence
             if thread:
                 thread.add_messages(messages)
+                remember_service_thread(thread, native_thread)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return AgentResponse(
                 agent_name=self.name,
@@ -153,13 +168,13 @@ class SupervisorAgent(IAgent):
                 messages=messages,
                 execution_time=execution_time,
                 metadata={
-                    "azure_response": str(response),
+                    **response_metadata(response),
                     "thread_id": thread.thread_id if thread else None,
                 },
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             raise AgentExecutionError(
                 f"Supervisor agent execution failed: {e}",
                 agent_name=self.name,
@@ -241,44 +256,11 @@ class SupervisorAgent(IAgent):
 
     def _convert_message(self, message: str | list[Message]) -> str:
         """Convert message to string format."""
-        if isinstance(message, str):
-            return message
-        elif isinstance(message, list) and message:
-            return message[-1].content
-        return ""
+        return convert_message(message)
 
     def _extract_messages(self, response: Any) -> list[Message]:
         """Extract messages from Azure agent response, filtering out internal delegation details."""
-        messages = []
-
-        try:
-            if hasattr(response, "messages") and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, "contents") and msg.contents:
-                        for content in msg.contents:
-                            # Skip FunctionCall and FunctionResult content (internal delegation details)
-                            # Only keep TextContent which contains actual responses
-                            content_type = type(content).__name__
-
-                            if "FunctionCall" in content_type or "FunctionResult" in content_type:
-                                # Skip internal delegation steps
-                                continue
-                            elif hasattr(content, "text"):
-                                # This is TextContent - the actual response
-                                text = content.text
-                                if text:
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text))
-                            else:
-                                # For other content types, try to convert to string
-                                text_str = str(content)
-                                if text_str and not text_str.startswith("<"):
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text_str))
-            else:
-                messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-        except Exception:
-            messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-
-        return messages
+        return extract_text_messages(response)
 
 
 def create_supervisor_agent() -> SupervisorAgent:
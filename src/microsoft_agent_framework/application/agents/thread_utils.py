@@ -0,0 +1,39 @@
+"""Shared helpers for binding conversation threads to Azure agent service threads."""
+
+from typing import Any
+
+from microsoft_agent_framework.domain.models import ConversationThread
+
+# Thread metadata key holding the Azure service-side thread that carries the conversation history
+SERVICE_THREAD_KEY = "service_thread_id"
+
+
+def new_native_thread(azure_agent: Any, thread: ConversationThread) -> Any:
+    """Create a native agent thread for a conversation.
+
+    When the conversation already has a service-side thread, it is resumed so the
+    service keeps the existing history instead of starting from an empty thread.
+
+    Args:
+        azure_agent: Azure agent that will run the conversation
+        thread: Conversation thread being continued
+
+    Returns:
+        Native agent thread
+    """
+    service_thread_id = thread.metadata.get(SERVICE_THREAD_KEY)
+    if service_thread_id:
+        return azure_agent.get_new_thread(service_thread_id=service_thread_id)
+    return azure_agent.get_new_thread()
+
+
+def remember_service_thread(thread: ConversationThread, native_thread: Any) -> None:
+    """Record the native thread's service-side ID on the conversation for later resumption.
+
+    Args:
+        thread: Conversation thread to update
+        native_thread: Native agent thread used for the last run
+    """
+    service_thread_id = getattr(native_thread, "service_thread_id", None)
+    if isinstance(service_thread_id, str):
+        thread.metadata[SERVICE_THREAD_KEY] = service_thread_id
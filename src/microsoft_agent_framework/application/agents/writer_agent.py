@@ -4,8 +4,16 @@ import time
 from typing import Any
 
 from agent_framework.azure import AzureAIAgentClient
-from azure.identity.aio import DefaultAzureCredential
 
+from microsoft_agent_framework.application.agents.message_utils import (
+    convert_message,
+    extract_text_messages,
+    response_metadata,
+)
+from microsoft_agent_framework.application.agents.thread_utils import (
+    new_native_thread,
+    remember_service_thread,
+)
 from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.exceptions import (
     AgentExecutionError,
@@ -22,6 +30,9 @@ from microsoft_agent_framework.domain.models import (
     MessageRole,
 )
 from microsoft_agent_framework.domain.prompts.writer_prompt import WRITER_PROMPT
+from microsoft_agent_framework.domain.utils import LRUCache
+from microsoft_agent_framework.infrastructure.llm_providers import get_project_client
+from microsoft_agent_framework.observability import ensure_observability
 
 
 class WriterAgent(IAgent):
@@ -31,7 +42,8 @@ class WriterAgent(IAgent):
         self._config = config
         self._azure_agent = None
         self._is_initialized = False
-        self._native_threads: dict[str, Any] = {}  # Map thread_id to native Azure agent thread
+        # Map thread_id to native Azure agent thread, evicting the coldest conversations
+        self._native_threads: LRUCache[str, Any] = LRUCache(settings.resilience.thread_cache_size)
 
     @property
     def name(self) -> str:
@@ -48,6 +60,8 @@ class WriterAgent(IAgent):
         if self._is_initialized:
             return
 
+        ensure_observability()
+
         try:
             # Validate Azure AI Foundry configuration
             if not settings.azure_ai_foundry.is_configured:
@@ -57,9 +71,8 @@ class WriterAgent(IAgent):
 
             # Create Azure AI Foundry agent client
             client = AzureAIAgentClient(
-                project_endpoint=settings.azure_ai_foundry.project_endpoint,
+                project_client=get_project_client(settings.azure_ai_foundry.project_endpoint),
                 model_deployment_name=settings.azure_ai_foundry.model_deployment_name,
-                async_credential=DefaultAzureCredential(),
             )
 
             # Create the underlying Azure agent in Azure AI Foundry
@@ -75,6 +88,8 @@ class WriterAgent(IAgent):
 
     async def cleanup(self) -> None:
         """Cleanup agent resources."""
+        # Native threads belong to the Azure agent being released
+        self._native_threads.clear()
         self._is_initialized = False
 
     async def run(
@@ -87,7 +102,7 @@ class WriterAgent(IAgent):
         if not self._is_initialized:
             await self.initialize()
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Convert message format
@@ -97,11 +112,10 @@ class WriterAgent(IAgent):
             native_thread = None
             if thread:
                 # Get existing native thread or create new one
-                if thread.thread_id in self._native_threads:
-                    native_thread = self._native_threads[thread.thread_id]
-                else:
-                    # Create new native thread from Azure agent
-                    native_thread = self._azure_agent.get_new_thread()
+                native_thread = self._native_threads.get(thread.thread_id)
+                if native_thread is None:
+                    # Create new native thread from Azure agent, resuming the conversation's service thread
+                    native_thread = new_native_thread(self._azure_agent, thread)
                     self._native_threads[thread.thread_id] = native_thread
 
                 # Add user message to custom thread for persistence
@@ -120,8 +134,9 @@ class WriterAgent(IAgent):
             # Add assistant messages to custom thread for persistence
             if thread:
                 thread.add_messages(messages)
+                remember_service_thread(thread, native_thread)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return AgentResponse(
                 agent_name=self.name,
@@ -129,13 +144,13 @@ class WriterAgent(IAgent):
                 messages=messages,
                 execution_time=execution_time,
                 metadata={
-                    "azure_response": str(response),
+                    **response_metadata(response),
                     "thread_id": thread.thread_id if thread else None,
                 },
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             raise AgentExecutionError(
                 f"Writer agent execution failed: {e}",
                 agent_name=self.name,
@@ -144,44 +159,11 @@ class WriterAgent(IAgent):
 
     def _convert_message(self, message: str | list[Message]) -> str:
         """Convert message to string format."""
-        if isinstance(message, str):
-            return message
-        elif isinstance(message, list) and message:
-            return message[-1].content
-        return ""
+        return convert_message(message)
 
     def _extract_messages(self, response: Any) -> list[Message]:
         """Extract messages from Azure agent response, filtering out internal delegation details."""
-        messages = []
-
-        try:
-            if hasattr(response, "messages") and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, "contents") and msg.contents:
-                        for content in msg.contents:
-                            # Skip FunctionCall and FunctionResult content (internal delegation details)
-                            # Only keep TextContent which contains actual responses
-                            content_type = type(content).__name__
-
-                            if "FunctionCall" in content_type or "FunctionResult" in content_type:
-                                # Skip internal delegation steps
-                                continue
-                            elif hasattr(content, "text"):
-                                # This is TextContent - the actual response
-                                text = content.text
-                                if text:
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text))
-                            else:
-                                # For other content types, try to convert to string
-                                text_str = str(content)
-                                if text_str and not text_str.startswith("<"):
-                                    messages.append(Message(role=MessageRole.ASSISTANT, content=text_str))
-            else:
-                messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-        except Exception:
-            messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-
-        return messages
+        return extract_text_messages(response)
 
 
 def create_writer_agent() -> WriterAgent:
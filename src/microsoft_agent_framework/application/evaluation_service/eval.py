@@ -9,9 +9,11 @@ This script:
 """
 
 import asyncio
+import hashlib
 import json
+import mmap
 import os
-from datetime import datetime
+from collections.abc import Iterator
 from pathlib import Path
 
 from azure.ai.projects import AIProjectClient
@@ -21,15 +23,44 @@ from azure.ai.projects.models import (
     EvaluatorIds,
     InputDataset,
 )
+from azure.core.exceptions import ResourceNotFoundError
 from azure.identity import DefaultAzureCredential
 from dotenv import load_dotenv
 
 from microsoft_agent_framework.application.agents.supervisor_agent import (
     main as agent_main,
 )
+from microsoft_agent_framework.infrastructure.llm_providers import close_shared_clients
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _loads = json.loads
+
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
 
 load_dotenv()
 
+# Queries in flight against the multi-agent system; each one creates its own Azure agents
+DEFAULT_EVAL_CONCURRENCY = "4"
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict]:
+    """Lazily decode a JSONL file, scanning lines over a read-only memory map."""
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if line.strip():
+                    yield _loads(line)
+
 
 async def call_agent(query: str) -> str:
     """
@@ -55,6 +86,11 @@ async def generate_responses(input_file: Path, output_file: Path):
     """
     Generate responses from the multi-agent system for each query in the input file.
 
+    Queries run concurrently on ``EVAL_CONCURRENCY`` workers. Each result is written
+    as soon as every earlier query has finished, so the output keeps the input
+    order. Workers never start a query more than ``2 * EVAL_CONCURRENCY`` rows past
+    the oldest unwritten one, so a slow query buffers at most that many results.
+
     Args:
         input_file: Path to JSONL file with queries and ground truth responses
         output_file: Path to save JSONL file with actual agent responses
@@ -65,41 +101,116 @@ async def generate_responses(input_file: Path, output_file: Path):
     print(f"Loading queries from: {input_file}")
     print("Generating agent responses...\n")
 
-    results = []
+    concurrency = max(1, int(os.environ.get("EVAL_CONCURRENCY", DEFAULT_EVAL_CONCURRENCY)))
+
+    async def process(idx: int, data: dict) -> dict:
+        query = data["query"]
+        ground_truth = data["response"]
+
+        print(f"[{idx}] Processing query: {query[:80]}...")
+
+        try:
+            # Call the actual multi-agent system
+            response = await call_agent(query)
+            print(f"    ✓ [{idx}] Got response ({len(response)} chars)")
+
+            return {"query": query, "response": response, "ground_truth": ground_truth}
+
+        except Exception as e:
+            print(f"    ✗ [{idx}] Error: {str(e)}")
+            # Add empty response on error
+            return {
+                "query": query,
+                "response": f"ERROR: {str(e)}",
+                "ground_truth": ground_truth,
+            }
+
+    print(f"Writing results to: {output_file}\n")
+    with open(output_file, "wb") as out_f:
+        # Shared by all workers; each pulls the next row when it becomes free
+        rows = enumerate(_iter_jsonl(input_file), 1)
+        finished: dict[int, bytes] = {}
+        next_to_write = 1
+        # Bounds the reorder buffer: rows past this window wait for earlier rows to be written
+        window = concurrency * 2
+        written = asyncio.Condition()
+
+        async def worker() -> None:
+            nonlocal next_to_write
+            for idx, data in rows:
+                async with written:
+                    while idx - next_to_write >= window:
+                        await written.wait()
+
+                finished[idx] = _dumps(await process(idx, data)) + b"\n"
+                if idx != next_to_write:
+                    continue
+                # Flush the contiguous run of finished rows to keep input order
+                while next_to_write in finished:
+                    out_f.write(finished.pop(next_to_write))
+                    next_to_write += 1
+                async with written:
+                    written.notify_all()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
 
-    with open(input_file) as f:
-        for idx, line in enumerate(f, 1):
-            data = json.loads(line)
-            query = data["query"]
-            ground_truth = data["response"]
+    return output_file
 
-            print(f"[{idx}] Processing query: {query[:80]}...")
 
-            try:
-                # Call the actual multi-agent system
-                response = await call_agent(query)
-                print(f"    ✓ Got response ({len(response)} chars)")
+def _dataset_version(output_file: Path) -> str:
+    """Derive a dataset version from the file's content hash."""
+    with open(output_file, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()[:16]
 
-                results.append({"query": query, "response": response, "ground_truth": ground_truth})
 
-            except Exception as e:
-                print(f"    ✗ Error: {str(e)}")
-                # Add empty response on error
-                results.append(
-                    {
-                        "query": query,
-                        "response": f"ERROR: {str(e)}",
-                        "ground_truth": ground_truth,
-                    }
-                )
+def _upload_dataset(project_client: AIProjectClient, output_file: Path) -> tuple[str, bool]:
+    """
+    Upload the results file as a dataset, reusing an existing identical version.
 
-    # Save results
-    print(f"\nSaving results to: {output_file}")
-    with open(output_file, "w") as f:
-        for result in results:
-            f.write(json.dumps(result) + "\n")
+    Args:
+        project_client: Azure AI Foundry project client
+        output_file: Path to JSONL file with agent responses and ground truth
 
-    return output_file
+    Returns:
+        Tuple of the dataset ID and whether an existing version was reused
+    """
+    dataset_name = "agent_evaluation_dataset"
+    # Version by content so re-running on unchanged results reuses the uploaded dataset
+    dataset_version = _dataset_version(output_file)
+
+    # upload_file overwrites an existing version instead of raising, so check first
+    try:
+        return project_client.datasets.get(name=dataset_name, version=dataset_version).id, True
+    except ResourceNotFoundError:
+        pass
+
+    data_id = project_client.datasets.upload_file(
+        name=dataset_name, version=dataset_version, file_path=str(output_file)
+    ).id
+    return data_id, False
+
+
+def _build_evaluators(model_deployment: str) -> dict[str, EvaluatorConfiguration]:
+    """Configure the Groundedness and Relevance cloud evaluators."""
+    return {
+        "groundedness": EvaluatorConfiguration(
+            id=EvaluatorIds.GROUNDEDNESS.value,
+            init_params={"deployment_name": model_deployment},
+            data_mapping={
+                "query": "${data.query}",
+                "context": "${data.ground_truth}",
+                "response": "${data.response}",
+            },
+        ),
+        "relevance": EvaluatorConfiguration(
+            id=EvaluatorIds.RELEVANCE.value,
+            init_params={"deployment_name": model_deployment},
+            data_mapping={
+                "query": "${data.query}",
+                "response": "${data.response}",
+            },
+        ),
+    }
 
 
 def evaluate_responses_cloud(output_file: Path):
@@ -134,46 +245,25 @@ def evaluate_responses_cloud(output_file: Path):
 
     # Upload dataset to Azure AI Foundry
     print("Uploading evaluation dataset...")
-    dataset_name = "agent_evaluation_dataset"
-    # Use timestamp for unique version
-    dataset_version = datetime.now().strftime("%Y%m%d_%H%M%S")
+    model_deployment = os.environ["AZURE_OPENAI_RESPONSES_DEPLOYMENT_NAME"]
 
     try:
-        data_id = project_client.datasets.upload_file(
-            name=dataset_name, version=dataset_version, file_path=str(output_file)
-        ).id
-        print(f"  ✓ Dataset uploaded with ID: {data_id}\n")
+        data_id, reused = _upload_dataset(project_client, output_file)
     except Exception as e:
         print(f"  ✗ Failed to upload dataset: {str(e)}\n")
         return None
 
-    # Configure cloud evaluators
-    model_deployment = os.environ["AZURE_OPENAI_RESPONSES_DEPLOYMENT_NAME"]
+    if reused:
+        print(f"  ✓ Dataset unchanged, reusing ID: {data_id}\n")
+    else:
+        print(f"  ✓ Dataset uploaded with ID: {data_id}\n")
+
+    evaluators = _build_evaluators(model_deployment)
 
     print("Configuring cloud evaluators:")
     print("  - Groundedness: Measures if response is grounded in the ground truth context")
     print("  - Relevance: Measures how relevant the response is to the query\n")
 
-    evaluators = {
-        "groundedness": EvaluatorConfiguration(
-            id=EvaluatorIds.GROUNDEDNESS.value,
-            init_params={"deployment_name": model_deployment},
-            data_mapping={
-                "query": "${data.query}",
-                "context": "${data.ground_truth}",
-                "response": "${data.response}",
-            },
-        ),
-        "relevance": EvaluatorConfiguration(
-            id=EvaluatorIds.RELEVANCE.value,
-            init_params={"deployment_name": model_deployment},
-            data_mapping={
-                "query": "${data.query}",
-                "response": "${data.response}",
-            },
-        ),
-    }
-
     # Submit cloud evaluation
     print("Submitting cloud evaluation job...")
     evaluation = Evaluation(
@@ -242,13 +332,29 @@ def evaluate_responses_cloud(output_file: Path):
         return None
 
 
-def run_evaluation(
+async def evaluate_responses_cloud_async(output_file: Path):
+    """
+    Evaluate the generated responses without blocking the running event loop.
+
+    The Azure AI Foundry SDK calls are synchronous, so ``evaluate_responses_cloud``
+    runs on a worker thread while the loop keeps servicing other tasks.
+
+    Args:
+        output_file: Path to JSONL file with agent responses and ground truth
+
+    Returns:
+        Evaluation result object from Azure AI Foundry
+    """
+    return await asyncio.to_thread(evaluate_responses_cloud, output_file)
+
+
+async def run_evaluation_async(
     input_file: str = "data/qr_data.jsonl",
     output_file: str = "data/evaluation_results.jsonl",
     skip_generation: bool = False,
 ):
     """
-    Run cloud evaluation on the multi-agent system.
+    Run cloud evaluation on the multi-agent system within the current event loop.
 
     Args:
         input_file: Path to JSONL file with queries and ground truth
@@ -277,8 +383,11 @@ def run_evaluation(
         print("STEP 1: GENERATING AGENT RESPONSES")
         print(f"{'=' * 80}\n")
 
-        loop = asyncio.get_event_loop()
-        output_path = loop.run_until_complete(generate_responses(input_path, output_path))
+        try:
+            output_path = await generate_responses(input_path, output_path)
+        finally:
+            # The agents share one project client and credential; close them on this loop
+            await close_shared_clients()
     else:
         print(f"Skipping response generation, using existing file: {output_path}")
 
@@ -287,7 +396,7 @@ def run_evaluation(
     print("STEP 2: CLOUD EVALUATION")
     print(f"{'=' * 80}\n")
 
-    result = evaluate_responses_cloud(output_path)
+    result = await evaluate_responses_cloud_async(output_path)
 
     if result:
         print(f"\n{'=' * 80}")
@@ -304,6 +413,27 @@ def run_evaluation(
     return result
 
 
+def run_evaluation(
+    input_file: str = "data/qr_data.jsonl",
+    output_file: str = "data/evaluation_results.jsonl",
+    skip_generation: bool = False,
+):
+    """
+    Run cloud evaluation on the multi-agent system.
+
+    Both stages share a single event loop; see ``run_evaluation_async``.
+
+    Args:
+        input_file: Path to JSONL file with queries and ground truth
+        output_file: Path to save agent responses before evaluation
+        skip_generation: If True, skip response generation and use existing output_file
+
+    Returns:
+        Evaluation result object
+    """
+    return asyncio.run(run_evaluation_async(input_file, output_file, skip_generation))
+
+
 if __name__ == "__main__":
     # Run evaluation on qr_data.jsonl
     # Set skip_generation=True if you already have evaluation_results.jsonl
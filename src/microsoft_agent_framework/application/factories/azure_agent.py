@@ -3,13 +3,17 @@
 import time
 from typing import Any
 
+from microsoft_agent_framework.application.agents.message_utils import (
+    convert_message,
+    extract_text_messages,
+    response_metadata,
+)
 from microsoft_agent_framework.domain.interfaces import IAgent
 from microsoft_agent_framework.domain.models import (
     AgentConfig,
     AgentResponse,
     AgentStatus,
     Message,
-    MessageRole,
 )
 
 
@@ -42,15 +46,11 @@ class AzureAgent(IAgent):
         Returns:
             AgentResponse containing the result
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
             # Convert our message format to what the Azure agent expects
-            if isinstance(message, str):
-                input_message = message
-            else:
-                # For now, just use the last message content
-                input_message = message[-1].content if message else ""
+            input_message = convert_message(message)
 
             # Execute the Azure agent
             response = await self._azure_agent.run(input_message, **kwargs)
@@ -58,18 +58,18 @@ class AzureAgent(IAgent):
             # Extract messages from the response
             messages = self._extract_messages(response)
 
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
 
             return AgentResponse(
                 agent_name=self.name,
                 status=AgentStatus.COMPLETED,
                 messages=messages,
                 execution_time=execution_time,
-                metadata={"azure_response": str(response)},
+                metadata=response_metadata(response),
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
             return AgentResponse(
                 agent_name=self.name,
                 status=AgentStatus.ERROR,
@@ -99,20 +99,4 @@ class AzureAgent(IAgent):
         Returns:
             List of extracted messages
         """
-        messages = []
-
-        try:
-            if hasattr(response, "messages") and response.messages:
-                for msg in response.messages:
-                    if hasattr(msg, "contents") and msg.contents:
-                        for content in msg.contents:
-                            text = content.text if hasattr(content, "text") else str(content)
-                            messages.append(Message(role=MessageRole.ASSISTANT, content=text))
-            else:
-                # Fallback: treat entire response as content
-                messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-        except Exception:
-            # Fallback: treat entire response as content
-            messages.append(Message(role=MessageRole.ASSISTANT, content=str(response)))
-
-        return messages
+        return extract_text_messages(response)
@@ -1,13 +1,35 @@
 """Application services."""
 
-from .agent_service import AgentService
-from .conversation_manager import ConversationManager
-from .conversation_service import ConversationService
-from .conversation_session import ConversationSession
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent_service import AgentService
+    from .conversation_manager import ConversationManager
+    from .conversation_service import ConversationService
+    from .conversation_session import ConversationSession, get_session
 
 __all__ = [
     "AgentService",
     "ConversationService",
     "ConversationManager",
     "ConversationSession",
+    "get_session",
 ]
+
+# Defining module for each export; session-only callers never import the settings stack
+_EXPORTS = {
+    "AgentService": ".agent_service",
+    "ConversationManager": ".conversation_manager",
+    "ConversationService": ".conversation_service",
+    "ConversationSession": ".conversation_session",
+    "get_session": ".conversation_session",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import service classes on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -1,6 +1,7 @@
 """Agent service for managing agent lifecycle and execution."""
 
 import asyncio
+import functools
 import logging
 from uuid import uuid4
 
@@ -21,35 +22,109 @@ from microsoft_agent_framework.domain.retry import (
 
 logger = logging.getLogger(__name__)
 
+_ERROR_STATUS = AgentStatus.ERROR.value
+
+# Error message templates, formatted only when an attempt actually fails
+_TIMEOUT_MSG = "Agent '{}' execution timed out after {} seconds"
+_EXEC_FAIL_MSG = "Agent '{}' execution failed: {}"
+
+
+def _error_response(agent_name: str, error: str) -> AgentResponse:
+    """Build a failed-execution response without re-running model validation.
+
+    Every field is known to be valid here, and this path runs once per failed
+    attempt, which becomes hot during a downstream outage.
+    """
+    return AgentResponse.model_construct(
+        agent_name=agent_name,
+        status=_ERROR_STATUS,
+        messages=[],
+        execution_time=0.0,
+        error=error,
+    )
+
+
+async def _execute_agent_once(
+    agent: IAgent, agent_id: str, message: str, timeout: float, semaphore: asyncio.Semaphore
+) -> AgentResponse:
+    """Run a single agent attempt, mapping failures to retryable exceptions.
+
+    Args:
+        agent: Agent to run
+        agent_id: Registered ID of the agent, used in error messages
+        message: Message to send to the agent
+        timeout: Timeout in seconds for this attempt
+        semaphore: Concurrency limit, held per attempt so backoff sleeps do not occupy a slot
+
+    Returns:
+        Agent response
+
+    Raises:
+        AgentTimeoutError: If the attempt times out
+        AgentExecutionError: If the agent raises
+    """
+    try:
+        async with semaphore:
+            return await asyncio.wait_for(agent.run(message), timeout=timeout)
+    except TimeoutError as e:
+        raise AgentTimeoutError(_TIMEOUT_MSG.format(agent_id, timeout), timeout_duration=timeout) from e
+    except Exception as e:
+        error = _EXEC_FAIL_MSG.format(agent_id, e)
+        logger.error(error)
+        raise AgentExecutionError(error, agent_name=agent.name) from e
+
 
 class AgentService(IService):
-    """Service for managing agents and their execution."""
+    """Service for managing agents and their execution.
+
+    At most ``agent_max_concurrency`` agent runs execute at once; further calls
+    wait for a free slot, keeping bursts within downstream model rate limits.
+    """
 
     def __init__(self):
         self._agents: dict[str, IAgent] = {}
+        # Immutable snapshot of the registered IDs, rebuilt only when registration changes
+        self._agent_ids: tuple[str, ...] = ()
         self._is_initialized = False
-        self._retry_policy = self._create_retry_policy()
-        self._retry_callbacks = LoggingRetryCallbacks("agent_service")
-
-    def _create_retry_policy(self) -> RetryPolicy:
+        # Created on first use so it binds to the running event loop
+        self._semaphore: asyncio.Semaphore | None = None
+        # Built from settings on the first retrying call; cleanup() drops it so a
+        # re-initialized service picks up settings.reload()
+        self._retry_policy: RetryPolicy | None = None
+        self._retry_callbacks: LoggingRetryCallbacks | None = None
+
+    def _get_retry_policy(self) -> RetryPolicy:
+        """Get this service's retry policy, building it on first use."""
+        if self._retry_policy is None:
+            self._retry_policy = self._create_retry_policy()
+        return self._retry_policy
+
+    def _get_retry_callbacks(self) -> LoggingRetryCallbacks:
+        """Get this service's retry callbacks, building them on first use."""
+        if self._retry_callbacks is None:
+            self._retry_callbacks = LoggingRetryCallbacks("agent_service")
+        return self._retry_callbacks
+
+    @staticmethod
+    def _create_retry_policy() -> RetryPolicy:
         """Create retry policy for agent operations."""
         return RetryPolicy(
             max_attempts=settings.resilience.agent_max_attempts,
             base_delay=settings.resilience.agent_base_delay,
             max_delay=settings.resilience.agent_max_delay,
             strategy=RetryStrategy.EXPONENTIAL,
-            retryable_exceptions={
+            retryable_exceptions=(
                 AgentTimeoutError,
                 ConnectionError,
                 TimeoutError,
                 asyncio.TimeoutError,
                 OSError,
-            },
-            non_retryable_exceptions={
+            ),
+            non_retryable_exceptions=(
                 AgentNotFoundError,
                 ValueError,
                 TypeError,
-            },
+            ),
         )
 
     @property
@@ -66,11 +141,28 @@ class AgentService(IService):
 
     async def cleanup(self) -> None:
         """Cleanup service resources."""
-        for agent in self._agents.values():
-            await agent.cleanup()
+        # Agents release independent resources, so clean them up concurrently and
+        # keep going if one of them fails
+        agent_ids = list(self._agents)
+        results = await asyncio.gather(
+            *(agent.cleanup() for agent in self._agents.values()),
+            return_exceptions=True,
+        )
+        for agent_id, result in zip(agent_ids, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Agent '{agent_id}' cleanup failed: {result}")
         self._agents.clear()
+        self._agent_ids = ()
+        self._semaphore = None
+        self._retry_policy = None
         self._is_initialized = False
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent agent executions."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(settings.resilience.agent_max_concurrency)
+        return self._semaphore
+
     def register_agent(self, agent_id: str, agent: IAgent) -> None:
         """
         Register an agent with the service.
@@ -80,6 +172,7 @@ class AgentService(IService):
             agent: Agent instance to register
         """
         self._agents[agent_id] = agent
+        self._agent_ids = tuple(self._agents)
 
     def get_agent(self, agent_id: str) -> IAgent | None:
         """
@@ -93,9 +186,9 @@ class AgentService(IService):
         """
         return self._agents.get(agent_id)
 
-    def get_all_agents(self) -> list[str]:
-        """Get list of all registered agent IDs."""
-        return list(self._agents.keys())
+    def get_all_agents(self) -> tuple[str, ...]:
+        """Get all registered agent IDs, in registration order."""
+        return self._agent_ids
 
     async def execute_agent(
         self,
@@ -127,45 +220,26 @@ class AgentService(IService):
 
         timeout = timeout or settings.resilience.agent_execution_timeout
 
-        async def _execute_with_timeout():
-            """Execute agent with timeout wrapper."""
-            try:
-                return await asyncio.wait_for(agent.run(message), timeout=timeout)
-            except TimeoutError as e:
-                raise AgentTimeoutError(
-                    f"Agent '{agent_id}' execution timed out after {timeout} seconds",
-                    timeout_duration=timeout,
-                ) from e
-            except Exception as e:
-                logger.error(f"Agent '{agent_id}' execution failed: {e}")
-                raise AgentExecutionError(f"Agent '{agent_id}' execution failed: {e}", agent_name=agent.name) from e
-
-        # Execute with or without retry based on configuration and parameter
-        if enable_retry and settings.resilience.enable_retries:
-            try:
-                return await retry_async(_execute_with_timeout, self._retry_policy, self._retry_callbacks)
-            except Exception as e:
-                # If retry fails, return error response instead of raising
-                logger.error(f"Agent '{agent_id}' execution failed after retries: {e}")
-                return AgentResponse(
-                    agent_name=agent.name,
-                    status=AgentStatus.ERROR,
-                    messages=[],
-                    execution_time=0.0,
-                    error=str(e),
-                )
-        else:
+        if not (enable_retry and settings.resilience.enable_retries):
+            # Fast path: a single attempt needs no closure or retry wrapper
             try:
-                return await _execute_with_timeout()
+                async with self._get_semaphore():
+                    return await asyncio.wait_for(agent.run(message), timeout=timeout)
+            except TimeoutError:
+                error = _TIMEOUT_MSG.format(agent_id, timeout)
             except Exception as e:
-                # Return error response for non-retry execution
-                return AgentResponse(
-                    agent_name=agent.name,
-                    status=AgentStatus.ERROR,
-                    messages=[],
-                    execution_time=0.0,
-                    error=str(e),
-                )
+                error = _EXEC_FAIL_MSG.format(agent_id, e)
+                logger.error(error)
+            # Return error response for non-retry execution
+            return _error_response(agent.name, error)
+
+        attempt = functools.partial(_execute_agent_once, agent, agent_id, message, timeout, self._get_semaphore())
+        try:
+            return await retry_async(attempt, self._get_retry_policy(), self._get_retry_callbacks())
+        except Exception as e:
+            # If retry fails, return error response instead of raising
+            logger.error(f"Agent '{agent_id}' execution failed after retries: {e}")
+            return _error_response(agent.name, str(e))
 
     async def create_conversation_session(self) -> str:
         """
@@ -174,4 +248,4 @@ class AgentService(IService):
         Returns:
             Session ID
         """
-        return str(uuid4())
+        return uuid4().hex
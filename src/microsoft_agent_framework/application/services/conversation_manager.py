@@ -5,9 +5,15 @@ from microsoft_agent_framework.application.services.conversation_service import
 )
 from microsoft_agent_framework.application.services.conversation_session import (
     ConversationSession,
+    get_session,
 )
 from microsoft_agent_framework.domain.interfaces import IAgent
-from microsoft_agent_framework.domain.models import AgentResponse, ConversationThread
+from microsoft_agent_framework.domain.models import (
+    AgentConfig,
+    AgentResponse,
+    AgentType,
+    ConversationThread,
+)
 
 
 class ConversationManager:
@@ -19,7 +25,9 @@ class ConversationManager:
         session_manager: ConversationSession | None = None,
     ):
         self.conversation_service = conversation_service
-        self.session_manager = session_manager or ConversationSession()
+        self.session_manager = session_manager or get_session()
+        # Agents created by smart_chat, reused across calls for the same agent type
+        self._agents: dict[str, IAgent] = {}
 
     async def chat(
         self,
@@ -44,9 +52,7 @@ class ConversationManager:
         Returns:
             Tuple of (agent_response, conversation_thread)
         """
-        agent_type = (
-            agent.config.agent_type.value if hasattr(agent.config.agent_type, "value") else str(agent.config.agent_type)
-        )
+        agent_type = self._agent_type_str(agent)
 
         # Determine which thread to use
         thread = await self._get_or_create_thread(
@@ -62,12 +68,20 @@ class ConversationManager:
 
         # Save thread if auto_save is enabled
         if auto_save:
-            await self.conversation_service.save_thread(thread)
+            # Written in the background so repository latency stays off the response path
+            self.conversation_service.queue_save(thread)
             # Update session to track this as current thread
             self.session_manager.set_current_thread_id(agent_type, thread.thread_id)
 
         return response, thread
 
+    @staticmethod
+    def _agent_type_str(agent: IAgent) -> str:
+        """Get an agent's type as a plain string, accepting enum or str configs."""
+        agent_type = agent.config.agent_type
+        # A single getattr instead of hasattr followed by a second lookup
+        return getattr(agent_type, "value", None) or str(agent_type)
+
     async def smart_chat(
         self,
         message: str,
@@ -89,16 +103,18 @@ class ConversationManager:
         Returns:
             Tuple of (agent_response, thread_id)
         """
-        from microsoft_agent_framework.application.factories import agent_factory
-        from microsoft_agent_framework.domain.models import AgentConfig, AgentType
-
-        # Create agent
-        config = AgentConfig(
-            name=f"{agent_type}_agent",
-            agent_type=AgentType(agent_type),
-            instructions="",
-        )
-        agent = agent_factory.create_agent(agent_type, config)
+        agent = self._agents.get(agent_type)
+        if agent is None:
+            # Imported lazily: the factory pulls in the Azure agent SDK
+            from microsoft_agent_framework.application.factories import agent_factory
+
+            # Create agent
+            config = AgentConfig(
+                name=f"{agent_type}_agent",
+                agent_type=AgentType(agent_type),
+                instructions="",
+            )
+            agent = self._agents[agent_type] = agent_factory.create_agent(agent_type, config)
 
         # Use the regular chat method
         response, thread = await self.chat(
@@ -121,9 +137,11 @@ class ConversationManager:
     ) -> ConversationThread:
         """Get existing thread or create new one."""
 
-        # If specific thread_id provided, use that
+        # If specific thread_id provided, use that; cached threads need no await
         if thread_id:
-            thread = await self.conversation_service.load_thread(thread_id)
+            thread = self.conversation_service.peek_thread(thread_id)
+            if thread is None:
+                thread = await self.conversation_service.load_thread(thread_id)
             if thread:
                 return thread
             else:
@@ -136,7 +154,10 @@ class ConversationManager:
         # Try to get current session thread
         current_thread_id = self.session_manager.get_current_thread_id(agent_type)
         if current_thread_id:
-            thread = await self.conversation_service.load_thread(current_thread_id)
+            # Resolved through the service, so a deleted thread is never resumed
+            thread = self.conversation_service.peek_thread(current_thread_id)
+            if thread is None:
+                thread = await self.conversation_service.load_thread(current_thread_id)
             if thread:
                 return thread
 
@@ -161,9 +182,7 @@ class ConversationManager:
         Returns:
             New ConversationThread
         """
-        agent_type = (
-            agent.config.agent_type.value if hasattr(agent.config.agent_type, "value") else str(agent.config.agent_type)
-        )
+        agent_type = self._agent_type_str(agent)
 
         # Clear current session for this agent type
         self.session_manager.clear_current_thread(agent_type)
@@ -195,6 +214,13 @@ class ConversationManager:
         """
         return await self.chat(agent=agent, message=message, thread_id=thread_id, auto_save=True)
 
+    async def cleanup(self) -> None:
+        """Clean up agents created by smart_chat."""
+        agents = list(self._agents.values())
+        self._agents.clear()
+        for agent in agents:
+            await agent.cleanup()
+
     def get_current_session_info(self) -> dict:
         """Get information about current conversation sessions."""
         return self.session_manager.get_session_info()
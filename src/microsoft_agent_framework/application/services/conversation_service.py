@@ -1,5 +1,10 @@
 """Service for managing conversation threads."""
 
+import asyncio
+import logging
+import time
+
+from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.interfaces import (
     IConversationRepository,
     IService,
@@ -8,14 +13,38 @@ from microsoft_agent_framework.domain.models import (
     ConversationSummary,
     ConversationThread,
 )
+from microsoft_agent_framework.domain.utils import LRUCache
+
+logger = logging.getLogger(__name__)
 
 
 class ConversationService(IService):
-    """Service for managing conversation threads."""
+    """Service for managing conversation threads.
+
+    Recently used threads are kept in an LRU cache for
+    ``conversation_cache_ttl`` seconds, so consecutive chat turns do not reload
+    the thread from the repository. Saves refresh and deletes evict the entry.
+    The cache holds its own copy of each thread and hands out copies, so turns
+    that are never saved do not leak into later loads.
+
+    ``queue_save`` persists threads in the background, coalescing repeated
+    saves of the same thread; ``flush_saves`` (and ``cleanup``) wait for them.
+    """
 
     def __init__(self, repository: IConversationRepository):
         self._repository = repository
         self._is_initialized = False
+        self._cache_ttl = settings.resilience.conversation_cache_ttl
+        self._thread_cache: LRUCache[str, tuple[float, ConversationThread]] = LRUCache(
+            settings.resilience.conversation_cache_size
+        )
+        # Summaries are a pure function of thread state, keyed by its version
+        self._summary_cache: LRUCache[tuple, ConversationSummary] = LRUCache(
+            settings.resilience.conversation_cache_size
+        )
+        # Threads waiting for a background save, latest state per thread_id
+        self._pending_saves: dict[str, ConversationThread] = {}
+        self._save_task: asyncio.Task | None = None
 
     @property
     def is_initialized(self) -> bool:
@@ -28,24 +57,86 @@ class ConversationService(IService):
 
     async def cleanup(self) -> None:
         """Cleanup service resources."""
+        await self.flush_saves()
+        self._thread_cache.clear()
+        self._summary_cache.clear()
         self._is_initialized = False
 
     async def create_thread(self, agent_name: str, agent_type: str, title: str | None = None) -> ConversationThread:
         """Create a new conversation thread."""
         thread = ConversationThread(agent_name=agent_name, agent_type=agent_type, title=title)
         await self._repository.save_thread(thread)
+        self._cache_thread(thread)
         return thread
 
     async def save_thread(self, thread: ConversationThread) -> None:
         """Save a conversation thread."""
         await self._repository.save_thread(thread)
+        self._cache_thread(thread)
+
+    def queue_save(self, thread: ConversationThread) -> None:
+        """
+        Save a conversation thread in the background.
+
+        The thread is cached immediately, so loads see it before it is written.
+        Must be called from a running event loop.
+
+        Args:
+            thread: Thread to persist
+        """
+        # The snapshot is never handed out, so later changes to ``thread`` are not written
+        self._pending_saves[thread.thread_id] = self._cache_thread(thread)
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._drain_saves())
+
+    async def _drain_saves(self) -> None:
+        """Write queued threads until none are left."""
+        while self._pending_saves:
+            thread_id = next(iter(self._pending_saves))
+            thread = self._pending_saves.pop(thread_id)
+            try:
+                await self._repository.save_thread(thread)
+            except Exception as e:
+                logger.error(f"Background save of thread '{thread_id}' failed: {e}")
+
+    async def flush_saves(self) -> None:
+        """Wait until all queued background saves have been written."""
+        if self._save_task is not None:
+            await self._save_task
+            self._save_task = None
+
+    def peek_thread(self, thread_id: str) -> ConversationThread | None:
+        """
+        Get a thread from the in-memory cache without touching the repository.
+
+        Args:
+            thread_id: ID of the thread to look up
+
+        Returns:
+            A copy of the cached thread, or None if it is not cached or has expired
+        """
+        thread = self._get_cached(thread_id)
+        return None if thread is None else thread.model_copy(deep=True)
 
     async def load_thread(self, thread_id: str) -> ConversationThread | None:
         """Load a conversation thread by ID."""
-        return await self._repository.load_thread(thread_id)
+        thread = self.peek_thread(thread_id)
+        if thread is not None:
+            return thread
+
+        thread = await self._repository.load_thread(thread_id)
+        if thread is None:
+            self._thread_cache.pop(thread_id)
+        else:
+            self._cache_thread(thread)
+        return thread
 
     async def delete_thread(self, thread_id: str) -> bool:
         """Delete a conversation thread."""
+        self._thread_cache.pop(thread_id)
+        # A queued or in-flight save must not recreate the thread after deletion
+        self._pending_saves.pop(thread_id, None)
+        await self.flush_saves()
         return await self._repository.delete_thread(thread_id)
 
     async def list_threads(
@@ -56,6 +147,7 @@ class ConversationService(IService):
         offset: int = 0,
     ) -> list[ConversationSummary]:
         """List conversation threads with optional filtering."""
+        await self.flush_saves()
         return await self._repository.list_threads(
             agent_name=agent_name, agent_type=agent_type, limit=limit, offset=offset
         )
@@ -68,30 +160,42 @@ class ConversationService(IService):
         limit: int | None = None,
     ) -> list[ConversationSummary]:
         """Search conversation threads by content."""
+        await self.flush_saves()
         return await self._repository.search_threads(
             query=query, agent_name=agent_name, agent_type=agent_type, limit=limit
         )
 
     async def cleanup_old_threads(self, days_old: int = 30) -> int:
         """Clean up threads older than specified days."""
+        # Deleted threads are unknown here, so drop everything cached
+        await self.flush_saves()
+        self._thread_cache.clear()
         return await self._repository.cleanup_old_threads(days_old)
 
     async def get_thread_summary(self, thread_id: str) -> ConversationSummary | None:
-        """Get a summary of a specific thread."""
-        thread = await self.load_thread(thread_id)
-        if not thread:
-            return None
-
-        last_message = thread.messages[-1] if thread.messages else None
-
-        return ConversationSummary(
-            thread_id=thread.thread_id,
-            agent_name=thread.agent_name,
-            agent_type=thread.agent_type,
-            title=thread.title,
-            message_count=len(thread.messages),
-            created_at=thread.created_at,
-            updated_at=thread.updated_at,
-            tags=thread.tags,
-            last_message_preview=last_message.content[:100] if last_message else None,
-        )
+        """Get a summary of a specific thread, without loading it if it is not cached."""
+        thread = self._get_cached(thread_id)
+        if thread is None:
+            return await self._repository.get_thread_summary(thread_id)
+
+        key = (thread.thread_id, thread.updated_at, len(thread.messages), thread.title, tuple(thread.tags))
+        summary = self._summary_cache.get(key)
+        if summary is None:
+            summary = ConversationSummary.from_thread(thread)
+            self._summary_cache[key] = summary
+        return summary
+
+    def _get_cached(self, thread_id: str) -> ConversationThread | None:
+        """Get the cached thread itself, or None if it is not cached or has expired."""
+        cached = self._thread_cache.get(thread_id)
+        if cached is not None:
+            cached_at, thread = cached
+            if time.monotonic() - cached_at < self._cache_ttl:
+                return thread
+        return None
+
+    def _cache_thread(self, thread: ConversationThread) -> ConversationThread:
+        """Store a copy of a thread in the cache with a fresh timestamp and return the copy."""
+        snapshot = thread.model_copy(deep=True)
+        self._thread_cache[thread.thread_id] = (time.monotonic(), snapshot)
+        return snapshot
@@ -1,82 +1,228 @@
 """Session management for automatic thread handling."""
 
+import asyncio
 import json
+import logging
+import os
+import threading
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+# Session files hold nothing but the thread ID, one file per agent type
+_THREAD_SUFFIX = ".thread"
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Durably replace ``path`` with ``text``."""
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(text)
+        # Data must be on disk before the rename, or a crash can leave an empty file behind
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, path)
+
 
 class ConversationSession:
-    """Manages conversation sessions with automatic thread handling."""
+    """Manages conversation sessions with automatic thread handling.
 
-    def __init__(self, session_dir: str = ".sessions"):
-        self.session_dir = Path(session_dir)
-        self.session_dir.mkdir(exist_ok=True)
-        self.current_session_file = self.session_dir / "current.json"
+    Each agent type's current thread ID lives in its own ``{agent_type}.thread``
+    file, so an update rewrites only that mapping and processes updating
+    different agent types never touch the same file.
 
-    def get_current_thread_id(self, agent_type: str = "supervisor") -> str | None:
-        """Get the current active thread ID for an agent type."""
-        if not self.current_session_file.exists():
-            return None
+    Session data is read once and kept in memory. Updates made inside a running
+    event loop are coalesced and written in the background after ``flush_delay``
+    seconds; outside an event loop they are written immediately. Call ``aclose()``
+    (or ``flush()``) before shutting down to persist pending updates.
+    """
 
+    def __init__(self, session_dir: str = ".sessions", flush_delay: float = 0.5):
+        self.session_dir = Path(session_dir)
+        self.session_dir.mkdir(exist_ok=True)
+        self.flush_delay = flush_delay
+
+        # Thread IDs known to be on disk; lets flushes with no net change skip the write
+        self._written: dict[str, str] = {}
+        self._threads = self._load()
+        self._dirty: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+        # Background and synchronous flushes share the same ``.tmp`` files, so writes
+        # run one at a time; clear_all_sessions bumps the generation under the same
+        # lock so snapshots taken before it are dropped instead of recreating files
+        self._write_lock = threading.Lock()
+        self._generation = 0
+
+    def _thread_file(self, agent_type: str) -> Path:
+        """Get the session file for an agent type."""
+        return self.session_dir / f"{agent_type}{_THREAD_SUFFIX}"
+
+    def _load(self) -> dict[str, str]:
+        """Read the current thread IDs from disk."""
+        self._migrate_legacy_session()
+
+        threads = {}
+        for path in self.session_dir.glob(f"*{_THREAD_SUFFIX}"):
+            try:
+                thread_id = path.read_text(encoding="utf-8").strip()
+            except OSError:
+                continue
+            if thread_id:
+                threads[path.stem] = thread_id
+        self._written = dict(threads)
+        return threads
+
+    def _migrate_legacy_session(self) -> None:
+        """Split a ``current.json`` session file from older versions into per-agent files."""
+        legacy_file = self.session_dir / "current.json"
         try:
-            with open(self.current_session_file) as f:
-                session_data = json.load(f)
+            session_data = json.loads(legacy_file.read_bytes())
+        except FileNotFoundError:
+            return
+        except ValueError:
+            session_data = {}
+
+        threads = session_data.get("threads") if isinstance(session_data, dict) else None
+        if isinstance(threads, dict):
+            for agent_type, thread_id in threads.items():
+                if isinstance(thread_id, str) and not self._thread_file(agent_type).exists():
+                    _write_atomic(self._thread_file(agent_type), thread_id)
+        legacy_file.unlink(missing_ok=True)
+
+    def _write(self, changes: dict[str, str | None], generation: int) -> None:
+        """Persist changed mappings; ``None`` removes the agent type's file."""
+        with self._write_lock:
+            if generation != self._generation:
+                # The session was cleared after this snapshot was taken
+                return
+            for agent_type, thread_id in changes.items():
+                if self._written.get(agent_type) == thread_id:
+                    continue
+                if thread_id is None:
+                    self._thread_file(agent_type).unlink(missing_ok=True)
+                    self._written.pop(agent_type, None)
+                else:
+                    _write_atomic(self._thread_file(agent_type), thread_id)
+                    self._written[agent_type] = thread_id
+
+    def _take_changes(self) -> dict[str, str | None]:
+        """Snapshot the pending changes and reset the dirty set."""
+        changes = {agent_type: self._threads.get(agent_type) for agent_type in self._dirty}
+        self._dirty = set()
+        return changes
+
+    def _mark_dirty(self, agent_type: str) -> None:
+        """Record a change and schedule a write."""
+        self._dirty.add(agent_type)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (sync CLI commands): persist right away
+            self.flush()
+            return
 
-            return session_data.get("threads", {}).get(agent_type)
-        except (json.JSONDecodeError, KeyError):
-            return None
+        if self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_delay, self._start_background_flush)
 
-    def set_current_thread_id(self, agent_type: str, thread_id: str) -> None:
-        """Set the current active thread ID for an agent type."""
-        session_data = {"threads": {}}
+    def _start_background_flush(self) -> None:
+        """Timer callback: write the current snapshot off the event loop."""
+        self._flush_handle = None
+        if self._flush_task is not None and not self._flush_task.done():
+            # A write is still in flight; try again once the delay has passed
+            self._flush_handle = asyncio.get_running_loop().call_later(self.flush_delay, self._start_background_flush)
+            return
+        self._flush_task = asyncio.ensure_future(self._flush_async())
 
-        # Load existing session data
-        if self.current_session_file.exists():
+    async def _flush_async(self) -> None:
+        """Write pending changes on a worker thread."""
+        if not self._dirty:
+            return
+        # Snapshot on the loop thread so the worker never sees a dict being mutated
+        generation = self._generation
+        changes = self._take_changes()
+        try:
+            await asyncio.to_thread(self._write, changes, generation)
+        except Exception as e:
+            # Keep the changes pending so the next flush retries them
+            self._dirty.update(changes)
+            logger.error(f"Failed to persist conversation session: {e}")
+
+    def flush(self) -> None:
+        """Synchronously write any pending changes to disk."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty:
+            generation = self._generation
+            changes = self._take_changes()
             try:
-                with open(self.current_session_file) as f:
-                    session_data = json.load(f)
-            except (json.JSONDecodeError, KeyError):
-                session_data = {"threads": {}}
+                self._write(changes, generation)
+            except Exception:
+                self._dirty.update(changes)
+                raise
+
+    async def aclose(self) -> None:
+        """Persist pending changes without blocking the event loop."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+        await self._flush_async()
 
-        # Ensure threads dict exists
-        if "threads" not in session_data:
-            session_data["threads"] = {}
+    def get_current_thread_id(self, agent_type: str = "supervisor") -> str | None:
+        """Get the current active thread ID for an agent type."""
+        return self._threads.get(agent_type)
 
-        # Update thread for agent type
-        session_data["threads"][agent_type] = thread_id
+    def set_current_thread_id(self, agent_type: str, thread_id: str) -> None:
+        """Set the current active thread ID for an agent type."""
+        if self._threads.get(agent_type) == thread_id:
+            return
 
-        # Save session data
-        with open(self.current_session_file, "w") as f:
-            json.dump(session_data, f, indent=2)
+        self._threads[agent_type] = thread_id
+        self._mark_dirty(agent_type)
 
     def clear_current_thread(self, agent_type: str) -> None:
         """Clear the current active thread for an agent type."""
-        if not self.current_session_file.exists():
-            return
-
-        try:
-            with open(self.current_session_file) as f:
-                session_data = json.load(f)
-
-            if "threads" in session_data and agent_type in session_data["threads"]:
-                del session_data["threads"][agent_type]
-
-                with open(self.current_session_file, "w") as f:
-                    json.dump(session_data, f, indent=2)
-        except (json.JSONDecodeError, KeyError):
-            pass
+        if self._threads.pop(agent_type, None) is not None:
+            self._mark_dirty(agent_type)
 
     def clear_all_sessions(self) -> None:
         """Clear all session data."""
-        if self.current_session_file.exists():
-            self.current_session_file.unlink()
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        with self._write_lock:
+            # Waits for an in-flight write and drops any snapshot still on its way to disk
+            self._generation += 1
+            self._dirty = set()
+            self._written = {}
+            self._threads = {}
+
+            for path in self.session_dir.glob(f"*{_THREAD_SUFFIX}"):
+                path.unlink(missing_ok=True)
 
     def get_session_info(self) -> dict:
         """Get current session information."""
-        if not self.current_session_file.exists():
-            return {"threads": {}}
+        return {"threads": dict(self._threads)}
 
-        try:
-            with open(self.current_session_file) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, KeyError):
-            return {"threads": {}}
+
+_session: ConversationSession | None = None
+
+
+def get_session() -> ConversationSession:
+    """
+    Get the process-wide session for the default session directory.
+
+    Session state is held in memory, so separate instances over the same
+    directory would not see each other's updates; share this one instead.
+
+    Returns:
+        Shared conversation session
+    """
+    global _session
+    if _session is None:
+        _session = ConversationSession()
+    return _session
@@ -1,42 +1,172 @@
 """Command-line interface for the Microsoft Agent Framework."""
 
 import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Coroutine
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from microsoft_agent_framework.application.factories import agent_factory
-from microsoft_agent_framework.application.services import (
-    AgentService,
-    ConversationService,
-)
-from microsoft_agent_framework.application.services.conversation_manager import (
-    ConversationManager,
-)
-from microsoft_agent_framework.application.services.conversation_session import (
-    ConversationSession,
-)
-from microsoft_agent_framework.config import settings
-from microsoft_agent_framework.domain.models import AgentConfig, AgentType
-from microsoft_agent_framework.infrastructure.repositories import (
-    FileConversationRepository,
+if TYPE_CHECKING:
+    from microsoft_agent_framework.application.services import ConversationService
+
+# Application modules pull in the agent framework and Azure SDKs, so commands
+# import what they need when they run; --help and config commands stay fast.
+
+# Command functions by CLI name, in help order; registered on an app by create_app()
+_COMMANDS: dict[str, Callable[..., Any]] = {}
+
+# Configuration keys masked by the config command unless --show-sensitive is given
+_SENSITIVE_KEYS = frozenset({"api_key", "applicationinsights_connection_string", "brave_api_key"})
+
+# User-facing names for the Azure OpenAI settings reported by validate
+_AZURE_SETTING_LABELS = MappingProxyType(
+    {
+        "api_key": "Azure OpenAI API key",
+        "endpoint": "Azure OpenAI endpoint",
+        "responses_deployment_name": "Azure OpenAI deployment name",
+    }
 )
 
-# Initialize Typer app
-app = typer.Typer(
-    name="microsoft_agent_framework",
-    help="Microsoft Agent Framework CLI - Multi-agent AI orchestration",
-    add_completion=False,
+# Descriptions shown by list-agents
+_AGENT_DESCRIPTIONS = MappingProxyType(
+    {
+        "supervisor": "Coordinates and delegates tasks to other agents",
+        "research": "Performs web research using search tools",
+        "writer": "Creates professional email content",
+    }
 )
 
+# Color and label for each message role in show-thread, keyed by MessageRole value
+_ROLE_STYLES = {"user": ("blue", "User"), "assistant": ("green", "Assistant"), "system": ("yellow", "System")}
+
 # Rich console for pretty output
 console = Console()
 
 
-@app.command()
+def _command(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Record a function as a CLI command named after it (``list_agents`` -> ``list-agents``)."""
+    _COMMANDS[func.__name__.replace("_", "-")] = func
+    return func
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run an async command body, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and not available on Windows
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
+
+def _async_command(func: Callable[..., Coroutine[Any, Any, None]]) -> Callable[..., None]:
+    """
+    Run an async command function and report its errors.
+
+    Any other exception is printed and turned into exit code 1, so scripts can
+    detect failures. ``typer.Exit`` and ``typer.Abort`` pass through unchanged.
+
+    Args:
+        func: Async command body
+
+    Returns:
+        Synchronous command that Typer can register
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> None:
+        try:
+            _run(func(*args, **kwargs))
+        except (typer.Exit, typer.Abort):
+            # Typer's own exits and Ctrl-C at a prompt keep their code and "Aborted!" message
+            raise
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {str(e)}")
+            raise typer.Exit(1) from e
+
+    return wrapper
+
+
+@functools.cache
+def _get_conversation_service() -> "ConversationService":
+    """Get the conversation service shared by every command run in this process."""
+    from microsoft_agent_framework.application.services import ConversationService
+    from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+    return ConversationService(FileConversationRepository())
+
+
+@asynccontextmanager
+async def _conversation_context() -> AsyncIterator["ConversationService"]:
+    """
+    Use the shared conversation service for one command.
+
+    The service is initialized on first use and keeps its thread cache between
+    commands; queued saves are written before the command's event loop closes.
+
+    Yields:
+        Initialized conversation service
+    """
+    conversation_service = _get_conversation_service()
+    if not conversation_service.is_initialized:
+        await conversation_service.initialize()
+    try:
+        yield conversation_service
+    finally:
+        await conversation_service.flush_saves()
+
+
+def _main_callback() -> None:
+    """Run before any command; exists only to make the app a command group."""
+
+
+def create_app(command: str | None = None) -> typer.Typer:
+    """
+    Build the Typer app.
+
+    Typer converts every registered command into a Click command on each run,
+    so when the invoked command is known only that one is registered.
+
+    Args:
+        command: Name of the command being invoked; registers all commands if None or unknown
+
+    Returns:
+        Typer app
+    """
+    app = typer.Typer(
+        name="microsoft_agent_framework",
+        help="Microsoft Agent Framework CLI - Multi-agent AI orchestration",
+        add_completion=False,
+    )
+    # A callback keeps the app a command group, so a lone command is still invoked by name
+    app.callback()(_main_callback)
+
+    if command in _COMMANDS:
+        app.command(name=command)(_COMMANDS[command])
+    else:
+        for name, func in _COMMANDS.items():
+            app.command(name=name)(func)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Build the full ``app`` on first access, for callers that use it directly."""
+    if name == "app":
+        return create_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@_command
 def info():
     """Display framework information."""
+    from rich.table import Table
+
+    from microsoft_agent_framework.config import settings
+
     table = Table(title="Microsoft Agent Framework Info")
 
     table.add_column("Setting", style="cyan")
@@ -54,9 +184,13 @@ def info():
     console.print(table)
 
 
-@app.command()
+@_command
 def list_agents():
     """List available agent types."""
+    from rich.table import Table
+
+    from microsoft_agent_framework.application.factories import agent_factory
+
     factory = agent_factory.get_factory()
     agent_types = factory.get_supported_types()
 
@@ -64,21 +198,15 @@ def list_agents():
     table.add_column("Agent Type", style="cyan")
     table.add_column("Description", style="green")
 
-    descriptions = {
-        "supervisor": "Coordinates and delegates tasks to other agents",
-        "research": "Performs web research using search tools",
-        "writer": "Creates professional email content",
-    }
-
     for agent_type in agent_types:
-        description = descriptions.get(agent_type, "No description available")
-        table.add_row(agent_type, description)
+        table.add_row(agent_type, _AGENT_DESCRIPTIONS.get(agent_type, "No description available"))
 
     console.print(table)
 
 
-@app.command()
-def chat(
+@_command
+@_async_command
+async def chat(
     message: str = typer.Argument(..., help="Message to send to the agent"),
     agent_type: str = typer.Option("supervisor", help="Type of agent to use"),
     new: bool = typer.Option(False, "--new", "-n", help="Start a new conversation"),
@@ -87,24 +215,23 @@ def chat(
     no_save: bool = typer.Option(False, "--no-save", help="Don't save the conversation"),
 ):
     """Chat with an agent (automatically manages conversation threads)."""
-
-    async def run_chat():
+    from microsoft_agent_framework.application.factories import agent_factory
+    from microsoft_agent_framework.application.services import ConversationManager, get_session
+    from microsoft_agent_framework.domain.models import AgentConfig, AgentType
+    from microsoft_agent_framework.infrastructure.llm_providers import close_shared_clients
+
+    async with _conversation_context() as conversation_service:
+        session_manager = get_session()
+        conversation_manager = ConversationManager(conversation_service, session_manager)
+
+        # Create agent
+        config = AgentConfig(
+            name=f"{agent_type}_agent",
+            agent_type=AgentType(agent_type),
+            instructions="",
+        )
+        agent = agent_factory.create_agent(agent_type, config)
         try:
-            # Initialize services
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
-
-            session_manager = ConversationSession()
-            conversation_manager = ConversationManager(conversation_service, session_manager)
-
-            # Create agent
-            config = AgentConfig(
-                name=f"{agent_type}_agent",
-                agent_type=AgentType(agent_type),
-                instructions="",
-            )
-            agent = agent_factory.create_agent(agent_type, config)
             await agent.initialize()
 
             # Show session info if continuing
@@ -131,32 +258,34 @@ def chat(
             )
 
             # Display response
-            status = response.status if isinstance(response.status, str) else response.status.value
+            status = response.status
+            if not isinstance(status, str):
+                status = status.value
             if status == "completed":
                 console.print("[green]Response:[/green]")
                 for msg in response.messages:
                     console.print(f"  {msg.content}")
-                message_count_info = f" | Messages: {len(thread.messages)}" if len(thread.messages) > 2 else ""
-                console.print(
-                    f"[dim]Time: {response.execution_time:.2f}s | Thread: {thread.thread_id}{message_count_info}[/dim]"
-                )
+                details = [f"Time: {response.execution_time:.2f}s", f"Thread: {thread.thread_id}"]
+                message_count = len(thread.messages)
+                if message_count > 2:
+                    details.append(f"Messages: {message_count}")
+                console.print(f"[dim]{' | '.join(details)}[/dim]")
 
                 if not no_save:
                     console.print("[green]💾 Conversation saved[/green]")
             else:
                 console.print(f"[red]Failed:[/red] {response.error}")
-
-            # Cleanup
-            await agent.cleanup()
-            await conversation_service.cleanup()
-
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
-
-    asyncio.run(run_chat())
+        finally:
+            # Persist the session pointer first: it is deferred, and a failing cleanup below
+            # would otherwise end the event loop before it is written
+            await session_manager.aclose()
+            try:
+                await agent.cleanup()
+            finally:
+                await close_shared_clients()
 
 
-@app.command()
+@_command
 def serve(
     host: str = typer.Option("0.0.0.0", help="Host to bind to"),
     port: int = typer.Option(8000, help="Port to bind to"),
@@ -166,58 +295,56 @@ def serve(
     import uvicorn
 
     console.print(f"[cyan]Starting server on {host}:{port}[/cyan]")
-    uvicorn.run(
-        "microsoft_agent_framework.infrastructure.api.main:app",
-        host=host,
-        port=port,
-        reload=reload,
-    )
+    if reload:
+        # The reloader re-imports the app in a fresh process, so it needs the import string
+        uvicorn.run(
+            "microsoft_agent_framework.infrastructure.api.main:app",
+            host=host,
+            port=port,
+            reload=True,
+        )
+        return
+
+    from microsoft_agent_framework.infrastructure.api.main import app as api_app
+
+    uvicorn.run(api_app, host=host, port=port)
 
 
-@app.command()
+@_command
 def config(
     show_sensitive: bool = typer.Option(False, help="Show sensitive configuration values"),
 ):
     """Display current configuration."""
+    from rich.table import Table
+
+    from microsoft_agent_framework.config import settings
+
     table = Table(title="Configuration")
     table.add_column("Section", style="cyan")
     table.add_column("Key", style="yellow")
     table.add_column("Value", style="green")
 
-    # App config
-    for key, value in settings.app.model_dump().items():
-        table.add_row("app", key, str(value))
-
-    # Azure config (hide sensitive values unless requested)
-    azure_config = settings.azure.model_dump()
-    if not show_sensitive:
-        azure_config["api_key"] = "***HIDDEN***"
-
-    for key, value in azure_config.items():
-        table.add_row("azure", key, str(value))
-
-    # Observability config
-    obs_config = settings.observability.model_dump()
-    if not show_sensitive and obs_config.get("applicationinsights_connection_string"):
-        obs_config["applicationinsights_connection_string"] = "***HIDDEN***"
-
-    for key, value in obs_config.items():
-        table.add_row("observability", key, str(value))
-
-    # Tools config
-    tools_config = settings.tools.model_dump()
-    if not show_sensitive and tools_config.get("brave_api_key"):
-        tools_config["brave_api_key"] = "***HIDDEN***"
-
-    for key, value in tools_config.items():
-        table.add_row("tools", key, str(value))
+    sections = {
+        "app": settings.app,
+        "azure": settings.azure,
+        "observability": settings.observability,
+        "tools": settings.tools,
+    }
+    for section, section_config in sections.items():
+        for key, value in section_config.model_dump().items():
+            # Hide sensitive values unless requested
+            if value and key in _SENSITIVE_KEYS and not show_sensitive:
+                value = "***HIDDEN***"
+            table.add_row(section, key, str(value))
 
     console.print(table)
 
 
-@app.command()
+@_command
 def validate():
     """Validate configuration and dependencies."""
+    from microsoft_agent_framework.config import settings
+
     console.print("[cyan]Validating configuration...[/cyan]")
 
     errors = []
@@ -225,12 +352,7 @@ def validate():
 
     # Check Azure OpenAI configuration
     try:
-        if not settings.azure.api_key:
-            errors.append("Azure OpenAI API key is not set")
-        if not settings.azure.endpoint:
-            errors.append("Azure OpenAI endpoint is not set")
-        if not settings.azure.responses_deployment_name:
-            errors.append("Azure OpenAI deployment name is not set")
+        errors.extend(f"{_AZURE_SETTING_LABELS[name]} is not set" for name in settings.azure.missing_settings)
     except Exception as e:
         errors.append(f"Azure configuration error: {e}")
 
@@ -258,234 +380,192 @@ def validate():
         raise typer.Exit(1)
 
 
-@app.command()
-def chat_with_thread(
+@_command
+@_async_command
+async def chat_with_thread(
     message: str = typer.Argument(..., help="Message to send to the agent"),
     thread_id: str | None = typer.Option(None, help="Thread ID to continue conversation"),
     agent_type: str = typer.Option("supervisor", help="Type of agent to use"),
     save_thread: bool = typer.Option(True, help="Save conversation thread"),
 ):
     """Chat with an agent using persisted conversation threads."""
+    from microsoft_agent_framework.application.factories import agent_factory
+    from microsoft_agent_framework.application.services import AgentService
+    from microsoft_agent_framework.domain.models import AgentConfig, AgentType
+    from microsoft_agent_framework.infrastructure.llm_providers import close_shared_clients
+
+    async with _conversation_context() as conversation_service:
+        # Load the thread first so a bad thread ID fails before any agent is built
+        thread = None
+        if thread_id:
+            thread = await conversation_service.load_thread(thread_id)
+            if not thread:
+                console.print(f"[red]Thread {thread_id} not found[/red]")
+                return
 
-    async def run_thread_chat():
-        try:
-            # Initialize conversation service
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
-
-            # Load or create thread
-            thread = None
-            if thread_id:
-                thread = await conversation_service.load_thread(thread_id)
-                if not thread:
-                    console.print(f"[red]Thread {thread_id} not found[/red]")
-                    return
-                console.print(f"[cyan]Continuing conversation in thread: {thread.thread_id}[/cyan]")
-            else:
-                # Create agent to get its info for thread creation
-                config = AgentConfig(
-                    name=f"{agent_type}_agent",
-                    agent_type=AgentType(agent_type),
-                    instructions="",
-                )
-                agent = agent_factory.create_agent(agent_type, config)
-                thread = agent.get_new_thread()
-                console.print(f"[cyan]Created new thread: {thread.thread_id}[/cyan]")
-
-            # Initialize agent service
-            agent_service = AgentService()
-            await agent_service.initialize()
-
-            # Create and register agent
-            config = AgentConfig(
-                name=f"{agent_type}_agent",
-                agent_type=AgentType(agent_type),
-                instructions="",
-            )
-            agent = agent_factory.create_agent(agent_type, config)
-            agent_service.register_agent("chat_agent", agent)
-
-            # Execute agent with thread
-            console.print(f"[cyan]Sending message: {message}[/cyan]")
-            response = await agent.run(message, thread=thread)
-
-            # Display response
-            status = response.status if isinstance(response.status, str) else response.status.value
-            if status == "completed":
-                console.print("[green]Agent Response:[/green]")
-                for msg in response.messages:
-                    console.print(f"  {msg.content}")
-                console.print(f"[dim]Execution time: {response.execution_time:.2f}s[/dim]")
-                console.print(f"[dim]Thread: {thread.thread_id}[/dim]")
-            else:
-                console.print(f"[red]Agent failed:[/red] {response.error}")
-
-            # Save thread if requested
-            if save_thread:
-                await conversation_service.save_thread(thread)
-                console.print(f"[green]Thread saved: {thread.thread_id}[/green]")
+        # Create the agent once; it also creates new threads
+        config = AgentConfig(
+            name=f"{agent_type}_agent",
+            agent_type=AgentType(agent_type),
+            instructions="",
+        )
+        agent = agent_factory.create_agent(agent_type, config)
 
-            # Cleanup
-            await agent_service.cleanup()
-            await conversation_service.cleanup()
+        if thread:
+            console.print(f"[cyan]Continuing conversation in thread: {thread.thread_id}[/cyan]")
+        else:
+            thread = agent.get_new_thread()
+            console.print(f"[cyan]Created new thread: {thread.thread_id}[/cyan]")
+
+        # Initialize agent service and register the agent
+        agent_service = AgentService()
+        await agent_service.initialize()
+        agent_service.register_agent("chat_agent", agent)
+
+        # Execute agent with thread
+        console.print(f"[cyan]Sending message: {message}[/cyan]")
+        response = await agent.run(message, thread=thread)
+
+        # Display response
+        status = response.status
+        if not isinstance(status, str):
+            status = status.value
+        if status == "completed":
+            console.print("[green]Agent Response:[/green]")
+            for msg in response.messages:
+                console.print(f"  {msg.content}")
+            console.print(f"[dim]Execution time: {response.execution_time:.2f}s[/dim]")
+            console.print(f"[dim]Thread: {thread.thread_id}[/dim]")
+        else:
+            console.print(f"[red]Agent failed:[/red] {response.error}")
 
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
+        # Save thread if requested
+        if save_thread:
+            await conversation_service.save_thread(thread)
+            console.print(f"[green]Thread saved: {thread.thread_id}[/green]")
 
-    asyncio.run(run_thread_chat())
+        # Cleanup
+        await agent_service.cleanup()
+        await close_shared_clients()
 
 
-@app.command()
-def list_threads(
+@_command
+@_async_command
+async def list_threads(
     agent_name: str | None = typer.Option(None, help="Filter by agent name"),
     agent_type: str | None = typer.Option(None, help="Filter by agent type"),
     limit: int = typer.Option(10, help="Maximum number of threads to show"),
 ):
     """List conversation threads."""
 
-    async def run_list():
-        try:
-            # Initialize conversation service
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
-
-            # Get threads
-            summaries = await conversation_service.list_threads(
-                agent_name=agent_name, agent_type=agent_type, limit=limit
-            )
-
-            if not summaries:
-                console.print("[yellow]No threads found[/yellow]")
-                return
-
-            # Display threads
-            console.print(f"[green]Found {len(summaries)} threads:[/green]")
-            for summary in summaries:
-                console.print(f"\n[bold]Thread: {summary.thread_id}[/bold]")
-                console.print(f"  Agent: {summary.agent_name} ({summary.agent_type})")
-                console.print(f"  Messages: {summary.message_count}")
-                console.print(f"  Created: {summary.created_at.strftime('%Y-%m-%d %H:%M')}")
-                console.print(f"  Updated: {summary.updated_at.strftime('%Y-%m-%d %H:%M')}")
-                if summary.title:
-                    console.print(f"  Title: {summary.title}")
-                if summary.last_message_preview:
-                    console.print(f"  Last: {summary.last_message_preview}...")
-
-            await conversation_service.cleanup()
-
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
-
-    asyncio.run(run_list())
+    async with _conversation_context() as conversation_service:
+        # Get threads
+        summaries = await conversation_service.list_threads(agent_name=agent_name, agent_type=agent_type, limit=limit)
 
+        if not summaries:
+            console.print("[yellow]No threads found[/yellow]")
+            return
 
-@app.command()
-def show_thread(
+        # Display threads
+        console.print(f"[green]Found {len(summaries)} threads:[/green]")
+        for summary in summaries:
+            console.print(f"\n[bold]Thread: {summary.thread_id}[/bold]")
+            console.print(f"  Agent: {summary.agent_name} ({summary.agent_type})")
+            console.print(f"  Messages: {summary.message_count}")
+            console.print(f"  Created: {summary.created_at.strftime('%Y-%m-%d %H:%M')}")
+            console.print(f"  Updated: {summary.updated_at.strftime('%Y-%m-%d %H:%M')}")
+            if summary.title:
+                console.print(f"  Title: {summary.title}")
+            if summary.last_message_preview:
+                console.print(f"  Last: {summary.last_message_preview}...")
+
+
+@_command
+@_async_command
+async def show_thread(
     thread_id: str = typer.Argument(..., help="Thread ID to display"),
     full: bool = typer.Option(False, help="Show full conversation"),
 ):
     """Show details of a conversation thread."""
 
-    async def run_show():
-        try:
-            # Initialize conversation service
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
-
-            # Load thread
-            thread = await conversation_service.load_thread(thread_id)
-            if not thread:
-                console.print(f"[red]Thread {thread_id} not found[/red]")
-                return
-
-            # Display thread info
-            console.print(f"[bold]Thread: {thread.thread_id}[/bold]")
-            console.print(f"Agent: {thread.agent_name} ({thread.agent_type})")
-            console.print(f"Messages: {len(thread.messages)}")
-            console.print(f"Created: {thread.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            console.print(f"Updated: {thread.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            if thread.title:
-                console.print(f"Title: {thread.title}")
-            if thread.tags:
-                console.print(f"Tags: {', '.join(thread.tags)}")
-
-            if full and thread.messages:
-                console.print("\n[bold]Conversation:[/bold]")
-                for i, msg in enumerate(thread.messages, 1):
-                    role_color = "blue" if msg.role == "user" else "green"
-                    role_name = "User" if msg.role == "user" else "Assistant"
-                    console.print(f"\n[{role_color}]{i}. {role_name}:[/{role_color}]")
-                    console.print(f"   {msg.content}")
-                    console.print(f"   [dim]{msg.timestamp.strftime('%Y-%m-%d %H:%M:%S')}[/dim]")
-
-            await conversation_service.cleanup()
-
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
-
-    asyncio.run(run_show())
-
+    async with _conversation_context() as conversation_service:
+        # Load thread
+        thread = await conversation_service.load_thread(thread_id)
+        if not thread:
+            console.print(f"[red]Thread {thread_id} not found[/red]")
+            return
 
-@app.command()
-def delete_thread(
+        # Display thread info
+        console.print(f"[bold]Thread: {thread.thread_id}[/bold]")
+        console.print(f"Agent: {thread.agent_name} ({thread.agent_type})")
+        console.print(f"Messages: {len(thread.messages)}")
+        console.print(f"Created: {thread.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        console.print(f"Updated: {thread.updated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        if thread.title:
+            console.print(f"Title: {thread.title}")
+        if thread.tags:
+            console.print(f"Tags: {', '.join(thread.tags)}")
+
+        if full and thread.messages:
+            # Render the whole conversation with a single print
+            lines = ["\n[bold]Conversation:[/bold]"]
+            for i, msg in enumerate(thread.messages, 1):
+                color, name = _ROLE_STYLES.get(msg.role.value, ("white", msg.role.value.title()))
+                lines.append(f"\n[{color}]{i}. {name}:[/{color}]")
+                lines.append(f"   {msg.content}")
+                lines.append(f"   [dim]{msg.timestamp:%Y-%m-%d %H:%M:%S}[/dim]")
+            console.print("\n".join(lines))
+
+
+@_command
+@_async_command
+async def delete_thread(
     thread_id: str = typer.Argument(..., help="Thread ID to delete"),
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ):
     """Delete a conversation thread."""
+    from microsoft_agent_framework.application.services import get_session
 
-    async def run_delete():
-        try:
-            # Initialize conversation service
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
+    async with _conversation_context() as conversation_service:
+        # Check if thread exists; the summary is enough for the confirmation prompt
+        summary = await conversation_service.get_thread_summary(thread_id)
+        if not summary:
+            console.print(f"[red]Thread {thread_id} not found[/red]")
+            return
 
-            # Check if thread exists
-            thread = await conversation_service.load_thread(thread_id)
-            if not thread:
-                console.print(f"[red]Thread {thread_id} not found[/red]")
+        if not confirm:
+            console.print(f"Thread: {summary.thread_id}")
+            console.print(f"Agent: {summary.agent_name}")
+            console.print(f"Messages: {summary.message_count}")
+            user_confirmed = typer.confirm("Are you sure you want to delete this thread?")
+            if not user_confirmed:
+                console.print("[yellow]Cancelled[/yellow]")
                 return
 
-            if not confirm:
-                console.print(f"Thread: {thread.thread_id}")
-                console.print(f"Agent: {thread.agent_name}")
-                console.print(f"Messages: {len(thread.messages)}")
-                user_confirmed = typer.confirm("Are you sure you want to delete this thread?")
-                if not user_confirmed:
-                    console.print("[yellow]Cancelled[/yellow]")
-                    return
-
-            # Delete thread
-            success = await conversation_service.delete_thread(thread_id)
-            if success:
-                console.print(f"[green]Thread {thread_id} deleted successfully[/green]")
-
-                # Clear from session if it was current
-                session_manager = ConversationSession()
-                session_info = session_manager.get_session_info()
-                for agent_type, current_id in session_info.get("threads", {}).items():
-                    if current_id == thread_id:
-                        session_manager.clear_current_thread(agent_type)
-                        console.print(f"[dim]Cleared from {agent_type} session[/dim]")
-            else:
-                console.print(f"[red]Failed to delete thread {thread_id}[/red]")
-
-            await conversation_service.cleanup()
-
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
-
-    asyncio.run(run_delete())
+        # Delete thread
+        success = await conversation_service.delete_thread(thread_id)
+        if success:
+            console.print(f"[green]Thread {thread_id} deleted successfully[/green]")
+
+            # Clear from session if it was current
+            session_manager = get_session()
+            session_info = session_manager.get_session_info()
+            for agent_type, current_id in session_info.get("threads", {}).items():
+                if current_id == thread_id:
+                    session_manager.clear_current_thread(agent_type)
+                    console.print(f"[dim]Cleared from {agent_type} session[/dim]")
+            await session_manager.aclose()
+        else:
+            console.print(f"[red]Failed to delete thread {thread_id}[/red]")
 
 
-@app.command()
+@_command
 def session():
     """Show current conversation sessions."""
+    from microsoft_agent_framework.application.services import get_session
+
     try:
-        session_manager = ConversationSession()
+        session_manager = get_session()
         session_info = session_manager.get_session_info()
 
         if not session_info.get("threads"):
@@ -500,14 +580,16 @@ def session():
         console.print(f"[red]Error:[/red] {str(e)}")
 
 
-@app.command()
+@_command
 def clear_session(
     agent_type: str | None = typer.Option(None, "--agent", "-a", help="Clear specific agent session"),
     all: bool = typer.Option(False, "--all", help="Clear all sessions"),
 ):
     """Clear conversation sessions."""
+    from microsoft_agent_framework.application.services import get_session
+
     try:
-        session_manager = ConversationSession()
+        session_manager = get_session()
 
         if all:
             session_manager.clear_all_sessions()
@@ -522,42 +604,32 @@ def clear_session(
         console.print(f"[red]Error:[/red] {str(e)}")
 
 
-@app.command()
-def recent(
+@_command
+@_async_command
+async def recent(
     agent_type: str | None = typer.Option(None, "--agent", "-a", help="Filter by agent type"),
     limit: int = typer.Option(5, "--limit", "-l", help="Number of conversations to show"),
 ):
     """Show recent conversations."""
 
-    async def run_recent():
-        try:
-            repository = FileConversationRepository()
-            conversation_service = ConversationService(repository)
-            await conversation_service.initialize()
+    async with _conversation_context() as conversation_service:
+        summaries = await conversation_service.list_threads(agent_type=agent_type, limit=limit)
 
-            summaries = await conversation_service.list_threads(agent_type=agent_type, limit=limit)
-
-            if not summaries:
-                console.print("[yellow]No recent conversations found[/yellow]")
-                return
-
-            console.print("[bold]Recent Conversations:[/bold]")
-            for i, summary in enumerate(summaries, 1):
-                title_display = f" - {summary.title}" if summary.title else ""
-                time_display = summary.updated_at.strftime("%m-%d %H:%M")
-                console.print(f"  {i}. [cyan]{summary.thread_id[:8]}...[/cyan]{title_display}")
-                console.print(f"     {summary.agent_type} | {summary.message_count} msgs | {time_display}")
-                if summary.last_message_preview:
-                    console.print(f"     [dim]{summary.last_message_preview[:60]}...[/dim]")
-                console.print()
-
-            await conversation_service.cleanup()
-
-        except Exception as e:
-            console.print(f"[red]Error:[/red] {str(e)}")
+        if not summaries:
+            console.print("[yellow]No recent conversations found[/yellow]")
+            return
 
-    asyncio.run(run_recent())
+        # Render the whole listing with a single print
+        lines = ["[bold]Recent Conversations:[/bold]"]
+        for i, summary in enumerate(summaries, 1):
+            title_display = f" - {summary.title}" if summary.title else ""
+            lines.append(f"  {i}. [cyan]{summary.thread_id[:8]}...[/cyan]{title_display}")
+            lines.append(f"     {summary.agent_type} | {summary.message_count} msgs | {summary.updated_at:%m-%d %H:%M}")
+            if summary.last_message_preview:
+                lines.append(f"     [dim]{summary.last_message_preview[:60]}...[/dim]")
+            lines.append("")
+        console.print("\n".join(lines))
 
 
 if __name__ == "__main__":
-    app()
+    create_app()()
@@ -1,10 +1,16 @@
 """Configuration management with proper validation and environment handling."""
 
+from collections.abc import Mapping
 from enum import Enum
+from functools import cache, cached_property
 from pathlib import Path
+from typing import Any
 
+from dotenv import dotenv_values
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
+from pydantic_settings.sources import ENV_FILE_SENTINEL, DotenvType
 
 
 class Environment(str, Enum):
@@ -16,10 +22,76 @@ class Environment(str, Enum):
     TESTING = "testing"
 
 
-class AzureOpenAIConfig(BaseSettings):
-    """Azure OpenAI specific configuration."""
+_ENV_FILE = ".env"
+
+
+@cache
+def _read_dotenv(env_files: tuple[Path, ...], encoding: str | None) -> Mapping[str, str]:
+    """Parse the env files once per process; ``Settings.reload()`` clears the cache."""
+    dotenv_vars: dict[str, str] = {}
+    for env_path in env_files:
+        if env_path.is_file() or env_path.is_fifo():
+            values = dotenv_values(env_path, encoding=encoding or "utf-8")
+            dotenv_vars.update((key.lower(), value) for key, value in values.items() if value is not None)
+    return dotenv_vars
+
+
+class _SharedDotEnvSettingsSource(PydanticBaseSettingsSource):
+    """Dotenv source that reuses one parse of each env file across all config classes."""
+
+    def __init__(self, settings_cls: type[BaseSettings], env_file: DotenvType | None) -> None:
+        super().__init__(settings_cls)
+        if env_file is None:
+            env_files: tuple[Path, ...] = ()
+        elif isinstance(env_file, (str, Path)):
+            env_files = (Path(env_file).expanduser().absolute(),)
+        else:
+            env_files = tuple(Path(path).expanduser().absolute() for path in env_file)
+        self.env_prefix = self.config.get("env_prefix", "")
+        self.env_vars = _read_dotenv(env_files, self.config.get("env_file_encoding"))
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    def get_field_value(self, field: FieldInfo, field_name: str) -> tuple[Any, str, bool]:
+        """Look up a field by its alias, or by its prefixed name when it has none."""
+        env_name = field.alias or f"{self.env_prefix}{field_name}"
+        return self.env_vars.get(env_name.lower()), env_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        """Return the values found in the env files, keyed for validation."""
+        data: dict[str, Any] = {}
+        for field_name, field in self.settings_cls.model_fields.items():
+            value, _, _ = self.get_field_value(field, field_name)
+            if value is not None:
+                data[field.alias or field_name] = value
+        return data
+
+
+class _EnvFileSettings(BaseSettings):
+    """Base for the config sections; ``.env`` is read once and shared between them."""
+
+    # ENV_FILE_SENTINEL is an empty path, so pydantic-settings' own dotenv source
+    # reads nothing; the shared source below reads _ENV_FILE instead. An explicit
+    # ``_env_file`` (including None) still replaces the default.
+    model_config = SettingsConfigDict(extra="ignore", env_file=ENV_FILE_SENTINEL)
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Swap in the shared dotenv source, keeping the default precedence."""
+        env_file = getattr(dotenv_settings, "env_file", ENV_FILE_SENTINEL)
+        if env_file == ENV_FILE_SENTINEL:
+            env_file = _ENV_FILE
+        shared_dotenv = _SharedDotEnvSettingsSource(settings_cls, env_file=env_file)
+        return init_settings, env_settings, shared_dotenv, file_secret_settings
+
+
+class AzureOpenAIConfig(_EnvFileSettings):
+    """Azure OpenAI specific configuration."""
 
     api_key: str | None = Field(default=None, alias="AZURE_OPENAI_API_KEY", description="Azure OpenAI API key")
     endpoint: str | None = Field(
@@ -38,25 +110,26 @@ class AzureOpenAIConfig(BaseSettings):
         description="Deployment name for responses",
     )
 
-    @property
+    @cached_property
+    def missing_settings(self) -> tuple[str, ...]:
+        """Names of the required fields that are not set, checked once per loaded config."""
+        return tuple(name for name in ("api_key", "endpoint", "responses_deployment_name") if not getattr(self, name))
+
+    @cached_property
     def is_configured(self) -> bool:
         """Check if Azure OpenAI is properly configured."""
-        return all([self.api_key, self.endpoint, self.responses_deployment_name])
+        return not self.missing_settings
 
     @field_validator("endpoint")
     @classmethod
     def validate_endpoint(cls, v: str) -> str:
-        """Ensure endpoint ends with /."""
-        if v:
-            return v.rstrip("/") + "/" if not v.endswith("/") else v
-        return v
+        """Ensure endpoint ends with a single /."""
+        return v.rstrip("/") + "/" if v else v
 
 
-class ObservabilityConfig(BaseSettings):
+class ObservabilityConfig(_EnvFileSettings):
     """Observability and tracing configuration."""
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
     enable_otel: bool = Field(default=True, alias="ENABLE_OTEL", description="Enable OpenTelemetry tracing")
     enable_sensitive_data: bool = Field(
         default=False,
@@ -71,11 +144,9 @@ class ObservabilityConfig(BaseSettings):
     )
 
 
-class AzureAIFoundryConfig(BaseSettings):
+class AzureAIFoundryConfig(_EnvFileSettings):
     """Azure AI Foundry project configuration."""
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
     project_endpoint: str | None = Field(
         default=None,
         alias="PROJECT_ENDPOINT",
@@ -95,31 +166,29 @@ class AzureAIFoundryConfig(BaseSettings):
         """Post-initialization to set environment variables for Azure AI library."""
         import os
 
-        # Ensure Azure AI library can find the endpoint
-        if self.project_endpoint and not os.getenv("AZURE_AI_PROJECT_ENDPOINT"):
-            os.environ["AZURE_AI_PROJECT_ENDPOINT"] = self.project_endpoint
-        # Set subscription ID for Azure AI library
-        if self.subscription_id and not os.getenv("AZURE_SUBSCRIPTION_ID"):
-            os.environ["AZURE_SUBSCRIPTION_ID"] = self.subscription_id
+        # Ensure Azure AI library can find the endpoint and subscription; setdefault
+        # leaves existing values alone, so rebuilding the config never rewrites them
+        if self.project_endpoint:
+            os.environ.setdefault("AZURE_AI_PROJECT_ENDPOINT", self.project_endpoint)
+        if self.subscription_id:
+            os.environ.setdefault("AZURE_SUBSCRIPTION_ID", self.subscription_id)
 
-    @property
+    @cached_property
     def is_configured(self) -> bool:
         """Check if Azure AI Foundry is properly configured."""
         return self.project_endpoint is not None
 
 
-class ToolsConfig(BaseSettings):
+class ToolsConfig(_EnvFileSettings):
     """Tools and external services configuration."""
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
     brave_api_key: str | None = Field(default=None, alias="BRAVE_API_KEY", description="Brave Search API key")
 
 
-class ResilienceConfig(BaseSettings):
+class ResilienceConfig(_EnvFileSettings):
     """Resilience and error handling configuration."""
 
-    model_config = SettingsConfigDict(env_prefix="RESILIENCE_", env_file=".env", extra="ignore")
+    model_config = SettingsConfigDict(env_prefix="RESILIENCE_")
 
     # Global Retry Settings
     enable_retries: bool = Field(default=True, description="Enable retry logic globally")
@@ -143,6 +212,16 @@ class ResilienceConfig(BaseSettings):
     connection_timeout: float = Field(default=30.0, description="Default connection timeout in seconds")
     read_timeout: float = Field(default=60.0, description="Default read timeout in seconds")
     connection_pool_size: int = Field(default=10, description="Default connection pool size")
+    thread_cache_size: int = Field(default=256, ge=1, description="Maximum native agent threads kept per agent")
+    conversation_cache_size: int = Field(
+        default=128, ge=1, description="Maximum conversation threads kept in memory by the conversation service"
+    )
+    conversation_cache_ttl: float = Field(
+        default=300.0, gt=0, description="Seconds a cached conversation thread is served before it is reloaded"
+    )
+    agent_max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum agent executions the agent service runs at once"
+    )
 
     # Error Handling Settings
     enable_error_tracking: bool = Field(default=True, description="Enable detailed error tracking")
@@ -155,14 +234,15 @@ class ResilienceConfig(BaseSettings):
     api_request_timeout: float = Field(default=30.0, description="API request timeout in seconds")
 
 
-class ApplicationConfig(BaseSettings):
+class ApplicationConfig(_EnvFileSettings):
     """Main application configuration."""
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
-
     # Environment
     environment: Environment = Field(default=Environment.DEVELOPMENT, description="Application environment")
     debug: bool = Field(default=True, description="Enable debug mode")
+    include_raw_response: bool = Field(
+        default=False, description="Attach the full Azure response text to agent response metadata"
+    )
 
     # API Configuration
     api_host: str = Field(default="0.0.0.0", description="API host")
@@ -186,78 +266,62 @@ class ApplicationConfig(BaseSettings):
             return Environment(v.lower())
         return v
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.environment == Environment.DEVELOPMENT
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.environment == Environment.PRODUCTION
 
 
 class Settings:
-    """Centralized settings management."""
+    """Centralized settings management.
+
+    Each section is built on first access and then stored on the instance, so
+    later reads are plain attribute lookups. Sections are validated once per
+    process and never cached on disk, since they carry API keys and secrets.
+    """
 
-    def __init__(self):
-        self._app: ApplicationConfig | None = None
-        self._azure: AzureOpenAIConfig | None = None
-        self._observability: ObservabilityConfig | None = None
-        self._tools: ToolsConfig | None = None
-        self._azure_ai_foundry: AzureAIFoundryConfig | None = None
-        self._resilience: ResilienceConfig | None = None
+    _SECTIONS = ("app", "azure", "observability", "tools", "azure_ai_foundry", "resilience")
 
-    @property
+    @cached_property
     def app(self) -> ApplicationConfig:
         """Get application configuration."""
-        if self._app is None:
-            self._app = ApplicationConfig()
-        return self._app
+        return ApplicationConfig()
 
-    @property
+    @cached_property
     def azure(self) -> AzureOpenAIConfig:
         """Get Azure OpenAI configuration."""
-        if self._azure is None:
-            self._azure = AzureOpenAIConfig()
-        return self._azure
+        return AzureOpenAIConfig()
 
-    @property
+    @cached_property
     def observability(self) -> ObservabilityConfig:
         """Get observability configuration."""
-        if self._observability is None:
-            self._observability = ObservabilityConfig()
-        return self._observability
+        return ObservabilityConfig()
 
-    @property
+    @cached_property
     def tools(self) -> ToolsConfig:
         """Get tools configuration."""
-        if self._tools is None:
-            self._tools = ToolsConfig()
-        return self._tools
+        return ToolsConfig()
 
-    @property
+    @cached_property
     def azure_ai_foundry(self) -> AzureAIFoundryConfig:
         """Get Azure AI Foundry configuration."""
-        if self._azure_ai_foundry is None:
-            self._azure_ai_foundry = AzureAIFoundryConfig()
-        return self._azure_ai_foundry
+        return AzureAIFoundryConfig()
 
-    @property
+    @cached_property
     def resilience(self) -> ResilienceConfig:
         """Get resilience configuration."""
-        if self._resilience is None:
-            self._resilience = ResilienceConfig()
-        return self._resilience
+        return ResilienceConfig()
 
     def reload(self) -> None:
         """Reload all configurations."""
-        self._app = None
-        self._azure = None
-        self._observability = None
-        self._tools = None
-        self._azure_ai_foundry = None
-        self._resilience = None
+        _read_dotenv.cache_clear()
+        for section in self._SECTIONS:
+            self.__dict__.pop(section, None)
 
 
 # Global settings instance
@@ -49,14 +49,7 @@ class IAgent(ABC):
         Returns:
             New ConversationThread instance
         """
-        return ConversationThread(
-            agent_name=self.name,
-            agent_type=(
-                self.config.agent_type.value
-                if hasattr(self.config.agent_type, "value")
-                else str(self.config.agent_type)
-            ),
-        )
+        return ConversationThread(agent_name=self.name, agent_type=self.config.agent_type)
 
     async def deserialize_thread(self, data: dict[str, Any]) -> ConversationThread:
         """
@@ -26,6 +26,16 @@ class IConversationRepository(ABC):
         """Delete a conversation thread."""
         pass
 
+    async def get_thread_summary(self, thread_id: str) -> ConversationSummary | None:
+        """
+        Get a summary of a thread by ID.
+
+        The default loads the full thread; repositories that keep summaries
+        should override it.
+        """
+        thread = await self.load_thread(thread_id)
+        return ConversationSummary.from_thread(thread) if thread else None
+
     @abstractmethod
     async def list_threads(
         self,
@@ -1,14 +1,14 @@
 """Domain models for agents and related entities."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import Enum
+from enum import StrEnum
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
-class AgentType(Enum):
+class AgentType(StrEnum):
     """Types of agents in the system."""
 
     SUPERVISOR = "supervisor"
@@ -16,7 +16,7 @@ class AgentType(Enum):
     WRITER = "writer"
 
 
-class MessageRole(Enum):
+class MessageRole(StrEnum):
     """Message roles in conversations."""
 
     USER = "user"
@@ -24,7 +24,7 @@ class MessageRole(Enum):
     SYSTEM = "system"
 
 
-class AgentStatus(Enum):
+class AgentStatus(StrEnum):
     """Agent execution status."""
 
     IDLE = "idle"
@@ -39,10 +39,11 @@ class Message:
 
     role: MessageRole
     content: str
-    timestamp: datetime = None
-    metadata: dict[str, Any] | None = None
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    metadata: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
+        # Defaults come from the field factories; only an explicit None needs replacing
         if self.timestamp is None:
             object.__setattr__(self, "timestamp", datetime.now(UTC))
         if self.metadata is None:
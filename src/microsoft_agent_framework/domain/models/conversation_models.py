@@ -27,7 +27,7 @@ class ThreadMetadata:
 class ConversationThread(BaseModel):
     """Represents a conversation thread that can be persisted and resumed."""
 
-    thread_id: str = Field(default_factory=lambda: str(uuid4()))
+    thread_id: str = Field(default_factory=lambda: uuid4().hex)
     agent_name: str
     agent_type: str
     messages: list[Message] = Field(default_factory=list)
@@ -125,3 +125,19 @@ class ConversationSummary(BaseModel):
     last_message_preview: str | None = None
 
     model_config = ConfigDict(use_enum_values=True)
+
+    @classmethod
+    def from_thread(cls, thread: ConversationThread) -> "ConversationSummary":
+        """Summarize a loaded conversation thread."""
+        last_message = thread.messages[-1] if thread.messages else None
+        return cls(
+            thread_id=thread.thread_id,
+            agent_name=thread.agent_name,
+            agent_type=thread.agent_type,
+            title=thread.title,
+            message_count=len(thread.messages),
+            created_at=thread.created_at,
+            updated_at=thread.updated_at,
+            tags=thread.tags,
+            last_message_preview=last_message.content[:100] if last_message else None,
+        )
@@ -1,4 +1,8 @@
-WRITER_PROMPT = """
+import sys
+
+# Interned so every agent build shares one object and equality checks short-circuit on identity
+WRITER_PROMPT = sys.intern(
+    """
 You are a Writer Agent specialized in crafting professional emails.
 
 Your responsibilities:
@@ -10,3 +14,4 @@ Your responsibilities:
 
 Create polished email drafts that effectively communicate the intended message.
 """
+)
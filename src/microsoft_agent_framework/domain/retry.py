@@ -6,7 +6,7 @@ import logging
 import random
 import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from enum import Enum
 from typing import Any, TypeVar
 
@@ -44,8 +44,8 @@ class RetryPolicy:
         strategy: RetryStrategy = RetryStrategy.EXPONENTIAL,
         backoff_multiplier: float = 2.0,
         jitter: bool = True,
-        retryable_exceptions: set[type[Exception]] | None = None,
-        non_retryable_exceptions: set[type[Exception]] | None = None,
+        retryable_exceptions: Collection[type[Exception]] | None = None,
+        non_retryable_exceptions: Collection[type[Exception]] | None = None,
     ):
         """
         Initialize retry policy.
@@ -57,8 +57,8 @@ class RetryPolicy:
             strategy: Retry strategy to use
             backoff_multiplier: Multiplier for exponential backoff
             jitter: Whether to add random jitter to delays
-            retryable_exceptions: Set of exception types that should trigger retries
-            non_retryable_exceptions: Set of exception types that should never be retried
+            retryable_exceptions: Exception types that should trigger retries
+            non_retryable_exceptions: Exception types that should never be retried
         """
         self.max_attempts = max_attempts
         self.base_delay = base_delay
@@ -66,20 +66,32 @@ class RetryPolicy:
         self.strategy = strategy
         self.backoff_multiplier = backoff_multiplier
         self.jitter = jitter
-        self.retryable_exceptions = retryable_exceptions or {
-            RateLimitError,
-            APIError,
-            ConnectionError,
-            TimeoutError,
-            asyncio.TimeoutError,
-            OSError,  # Include network-related errors
-        }
-        self.non_retryable_exceptions = non_retryable_exceptions or {
-            AuthenticationError,
-            AuthorizationError,
-            ValueError,
-            TypeError,
-        }
+        # Frozen so the isinstance tuples below can never drift from them
+        self.retryable_exceptions = frozenset(
+            retryable_exceptions
+            or {
+                RateLimitError,
+                APIError,
+                ConnectionError,
+                TimeoutError,
+                asyncio.TimeoutError,
+                OSError,  # Include network-related errors
+            }
+        )
+        self.non_retryable_exceptions = frozenset(
+            non_retryable_exceptions
+            or {
+                AuthenticationError,
+                AuthorizationError,
+                ValueError,
+                TypeError,
+            }
+        )
+        # isinstance accepts a tuple of types and checks them all in C
+        self._retryable_types = tuple(self.retryable_exceptions)
+        self._non_retryable_types = tuple(self.non_retryable_exceptions)
+        # Decision per concrete exception type; the type tuples are fixed, so it never changes
+        self._decisions: dict[type, bool] = {}
 
     def should_retry(self, exception: Exception, attempt: int) -> bool:
         """
@@ -95,12 +107,15 @@ class RetryPolicy:
         if attempt >= self.max_attempts:
             return False
 
-        # Check non-retryable exceptions first
-        if any(isinstance(exception, exc_type) for exc_type in self.non_retryable_exceptions):
-            return False
-
-        # Check retryable exceptions
-        return any(isinstance(exception, exc_type) for exc_type in self.retryable_exceptions)
+        exc_type = type(exception)
+        retryable = self._decisions.get(exc_type)
+        if retryable is None:
+            # Non-retryable exceptions take precedence over retryable ones
+            retryable = not isinstance(exception, self._non_retryable_types) and isinstance(
+                exception, self._retryable_types
+            )
+            self._decisions[exc_type] = retryable
+        return retryable
 
     def calculate_delay(self, attempt: int) -> float:
         """
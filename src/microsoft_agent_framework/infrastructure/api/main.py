@@ -15,6 +15,9 @@ from microsoft_agent_framework.application.services import (
     ConversationService,
     ConversationSession,
 )
+from microsoft_agent_framework.application.services import (
+    get_session as get_shared_session,
+)
 from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.exceptions import (
     AgentExecutionError,
@@ -29,6 +32,7 @@ from microsoft_agent_framework.domain.exceptions import (
     TimeoutError,
     ValidationError,
 )
+from microsoft_agent_framework.infrastructure.llm_providers import close_shared_clients
 from microsoft_agent_framework.infrastructure.repositories import (
     FileConversationRepository,
 )
@@ -93,7 +97,7 @@ async def get_conversation_session() -> ConversationSession:
     """Dependency injection for conversation session."""
     global _conversation_session
     if _conversation_session is None:
-        _conversation_session = ConversationSession()
+        _conversation_session = get_shared_session()
 
     return _conversation_session
 
@@ -119,6 +123,15 @@ async def lifespan(app: FastAPI):
         await app.state.agent_service.cleanup()
     if hasattr(app.state, "conversation_service"):
         await app.state.conversation_service.cleanup()
+    elif _conversation_service is not None:
+        # Flushes conversation saves still queued in the background
+        await _conversation_service.cleanup()
+    if _conversation_manager is not None:
+        await _conversation_manager.cleanup()
+    if _conversation_session is not None:
+        await _conversation_session.aclose()
+    # After the agents are cleaned up, release the project client and credential they share
+    await close_shared_clients()
     print("🔄 Agent API shutdown complete")
 
 
@@ -509,9 +522,10 @@ async def reset_memory(request: ResetMemoryRequest):
 @app.get("/agents")
 async def list_agents(agent_service: AgentService = Depends(get_agent_service)):  # noqa: B008
     """List all registered agents."""
+    agent_ids = agent_service.get_all_agents()
     return {
-        "agents": agent_service.get_all_agents(),
-        "total": len(agent_service.get_all_agents()),
+        "agents": agent_ids,
+        "total": len(agent_ids),
     }
 
 
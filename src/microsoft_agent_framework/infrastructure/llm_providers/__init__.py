@@ -0,0 +1,11 @@
+"""LLM provider helpers."""
+
+from .azure_ai import close_shared_clients, get_project_client
+from .azure_credentials import close_async_credential, get_async_credential
+
+__all__ = [
+    "close_async_credential",
+    "close_shared_clients",
+    "get_async_credential",
+    "get_project_client",
+]
@@ -0,0 +1,34 @@
+"""Shared Azure AI Foundry project clients."""
+
+from azure.ai.projects.aio import AIProjectClient
+
+from .azure_credentials import close_async_credential, get_async_credential
+
+_project_clients: dict[str, AIProjectClient] = {}
+
+
+def get_project_client(endpoint: str) -> AIProjectClient:
+    """Get the process-wide async project client for an endpoint.
+
+    Agent clients built on top of it share one HTTP pipeline and connection pool
+    instead of each opening their own.
+
+    Args:
+        endpoint: Azure AI Foundry project endpoint
+
+    Returns:
+        The cached AIProjectClient instance
+    """
+    client = _project_clients.get(endpoint)
+    if client is None:
+        client = _project_clients[endpoint] = AIProjectClient(endpoint=endpoint, credential=get_async_credential())
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close the shared project clients and credential, e.g. on application shutdown."""
+    clients = list(_project_clients.values())
+    _project_clients.clear()
+    for client in clients:
+        await client.close()
+    await close_async_credential()
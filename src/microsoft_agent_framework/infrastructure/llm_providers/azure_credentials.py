@@ -0,0 +1,33 @@
+"""Shared Azure credentials for agent clients."""
+
+from functools import lru_cache
+
+from azure.identity.aio import DefaultAzureCredential
+
+
+@lru_cache(maxsize=1)
+def get_async_credential() -> DefaultAzureCredential:
+    """Get the process-wide async Azure credential.
+
+    DefaultAzureCredential probes several auth sources on construction, so the
+    supervisor and its sub-agents share one instance instead of building their own.
+    Reusing it also reuses its token cache across agents and runs.
+
+    Returns:
+        The cached DefaultAzureCredential instance
+    """
+    return DefaultAzureCredential()
+
+
+async def close_async_credential() -> None:
+    """Close the shared credential, if it was created.
+
+    Meant for application shutdown rather than per-agent cleanup, so the token
+    cache survives for the lifetime of the process.
+    """
+    if not get_async_credential.cache_info().currsize:
+        return
+
+    credential = get_async_credential()
+    get_async_credential.cache_clear()
+    await credential.close()
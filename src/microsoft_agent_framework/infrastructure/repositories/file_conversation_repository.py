@@ -1,7 +1,11 @@
 """File-based implementation of conversation repository."""
 
+import asyncio
 import json
+import os
+import threading
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 
 from microsoft_agent_framework.domain.interfaces.conversation_repository_interface import (
@@ -12,14 +16,30 @@ from microsoft_agent_framework.domain.models.conversation_models import (
     ConversationThread,
 )
 
+# Thread summaries by file name; the suffix keeps it out of the "*.json" thread scans
+_INDEX_FILE = "threads.index"
+_INDEX_VERSION = 1
+
 
 class FileConversationRepository(IConversationRepository):
-    """File-based conversation repository implementation."""
+    """File-based conversation repository implementation.
+
+    Listing reads thread summaries from an index file that is checked against
+    each thread file's mtime and size, so only new or changed threads are parsed.
+    Listing and searching run on a worker thread to keep the event loop
+    responsive and let several run at once.
+    """
 
     def __init__(self, storage_dir: str = "conversations"):
         """Initialize with storage directory."""
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
+        self._index_path = self.storage_dir / _INDEX_FILE
+        # Loaded on first listing; guarded because listings run on worker threads
+        self._index: dict[str, dict] | None = None
+        self._index_lock = threading.Lock()
+        # Files rewritten by this repository, dropped from the index on the next refresh
+        self._stale_files: set[str] = set()
 
     def _get_thread_path(self, thread_id: str) -> Path:
         """Get the file path for a thread."""
@@ -32,9 +52,23 @@ class FileConversationRepository(IConversationRepository):
 
         with open(thread_path, "w", encoding="utf-8") as f:
             json.dump(serialized_data, f, indent=2, ensure_ascii=False)
+        self._invalidate_index_entry(thread_path)
+
+    def _invalidate_index_entry(self, thread_path: Path) -> None:
+        """Force the next listing to re-read a thread this repository just changed.
+
+        Covers rewrites that leave both mtime and size unchanged on filesystems
+        with coarse timestamps. Only records the name, so the event loop never
+        waits on the index lock.
+        """
+        self._stale_files.add(thread_path.name)
 
     async def load_thread(self, thread_id: str) -> ConversationThread | None:
         """Load a conversation thread from file."""
+        return self._load_thread_sync(thread_id)
+
+    def _load_thread_sync(self, thread_id: str) -> ConversationThread | None:
+        """Load a conversation thread from file (blocking)."""
         thread_path = self._get_thread_path(thread_id)
 
         if not thread_path.exists():
@@ -70,54 +104,162 @@ class FileConversationRepository(IConversationRepository):
         offset: int = 0,
     ) -> list[ConversationSummary]:
         """List conversation threads with optional filtering."""
-        summaries = []
+        return await asyncio.to_thread(self._list_threads_sync, agent_name, agent_type, limit, offset)
 
-        # Get all JSON files in the storage directory
-        json_files = list(self.storage_dir.glob("*.json"))
-
-        # Sort by modification time (newest first)
-        json_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+    def _list_threads_sync(
+        self,
+        agent_name: str | None = None,
+        agent_type: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ConversationSummary]:
+        """List conversation threads with optional filtering (blocking)."""
+        entries = self._refresh_index()
+
+        # Newest first and filtered on the index; unreadable threads are dropped before
+        # paginating, and summaries are only built up to the end of the requested page
+        matches = (
+            entry
+            for entry in sorted(entries, key=lambda e: e["mtime_ns"], reverse=True)
+            if (not agent_name or entry["agent_name"] == agent_name)
+            and (not agent_type or entry["agent_type"] == agent_type)
+        )
+        summaries = (summary for entry in matches if (summary := self._summary_from_entry(entry)) is not None)
+        start = max(offset, 0)
+        return list(islice(summaries, start, start + limit if limit else None))
+
+    async def get_thread_summary(self, thread_id: str) -> ConversationSummary | None:
+        """Get a summary of a thread, from the index when it is up to date."""
+        return await asyncio.to_thread(self._get_thread_summary_sync, thread_id)
+
+    def _get_thread_summary_sync(self, thread_id: str) -> ConversationSummary | None:
+        """Get a summary of a thread (blocking)."""
+        thread_path = self._get_thread_path(thread_id)
+        try:
+            stat = thread_path.stat()
+        except OSError:
+            return None
 
-        for file_path in json_files:
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Apply filters
-                if agent_name and data.get("agent_name") != agent_name:
-                    continue
-                if agent_type and data.get("agent_type") != agent_type:
-                    continue
-
-                # Create summary
-                messages = data.get("messages", [])
-                last_message = messages[-1] if messages else None
-
-                summary = ConversationSummary(
-                    thread_id=data["thread_id"],
-                    agent_name=data["agent_name"],
-                    agent_type=data["agent_type"],
-                    title=data.get("title"),
-                    message_count=len(messages),
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                    updated_at=datetime.fromisoformat(data["updated_at"]),
-                    tags=data.get("tags", []),
-                    last_message_preview=(last_message["content"][:100] if last_message else None),
-                )
-
-                summaries.append(summary)
-
-            except (json.JSONDecodeError, KeyError, ValueError):
-                # Skip corrupted files
-                continue
+        with self._index_lock:
+            if thread_path.name in self._stale_files:
+                entry = None
+            else:
+                entry = (self._index or {}).get(thread_path.name)
+            if not entry or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                entry = self._index_entry(thread_path, stat)
+        return self._summary_from_entry(entry)
+
+    @staticmethod
+    def _summary_from_entry(entry: dict) -> ConversationSummary | None:
+        """Build a summary from an index entry, or None for unreadable threads."""
+        if entry.get("thread_id") is None:
+            return None
+        try:
+            return ConversationSummary(
+                thread_id=entry["thread_id"],
+                agent_name=entry["agent_name"],
+                agent_type=entry["agent_type"],
+                title=entry["title"],
+                message_count=entry["message_count"],
+                created_at=datetime.fromisoformat(entry["created_at"]),
+                updated_at=datetime.fromisoformat(entry["updated_at"]),
+                tags=entry["tags"],
+                last_message_preview=entry["last_message_preview"],
+            )
+        except ValueError:
+            # Threads with invalid field values are skipped
+            return None
 
-        # Apply pagination
-        if offset > 0:
-            summaries = summaries[offset:]
-        if limit:
-            summaries = summaries[:limit]
+    def _refresh_index(self) -> list[dict]:
+        """
+        Bring the summary index up to date with the storage directory.
+
+        Index entries are keyed by file name and tagged with the file's mtime and
+        size, so only files that were added or changed since the last refresh
+        (by this or any other process) are read and parsed.
+
+        Returns:
+            Index entries for all readable threads
+        """
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._read_index()
+
+            index = self._index
+            changed = False
+            while self._stale_files:
+                index.pop(self._stale_files.pop(), None)
+            seen = set()
+            with os.scandir(self.storage_dir) as it:
+                for dir_entry in it:
+                    if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                        continue
+                    seen.add(dir_entry.name)
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    entry = index.get(dir_entry.name)
+                    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                        continue
+                    index[dir_entry.name] = self._index_entry(Path(dir_entry.path), stat)
+                    changed = True
+
+            for name in index.keys() - seen:
+                del index[name]
+                changed = True
+
+            if changed:
+                self._write_index(index)
+            return [entry for entry in index.values() if entry.get("thread_id") is not None]
+
+    @staticmethod
+    def _index_entry(file_path: Path, stat: os.stat_result) -> dict:
+        """Summarize one thread file for the index; unreadable files get an entry without a thread_id."""
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
 
-        return summaries
+            messages = data.get("messages", [])
+            last_message = messages[-1] if messages else None
+            entry.update(
+                thread_id=data["thread_id"],
+                agent_name=data["agent_name"],
+                agent_type=data["agent_type"],
+                title=data.get("title"),
+                message_count=len(messages),
+                created_at=data["created_at"],
+                updated_at=data["updated_at"],
+                tags=data.get("tags", []),
+                last_message_preview=(last_message["content"][:100] if last_message else None),
+            )
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+            # Corrupted files are remembered so they are not re-read until they change
+            pass
+        return entry
+
+    def _read_index(self) -> dict[str, dict]:
+        """Load the persisted summary index, starting empty if it is missing or unreadable."""
+        try:
+            with open(self._index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write_index(self, index: dict[str, dict]) -> None:
+        """Persist the summary index; it is only a cache, so failures are ignored."""
+        tmp_path = self._index_path.with_name(self._index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": _INDEX_VERSION, "files": index}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            pass
 
     async def search_threads(
         self,
@@ -127,15 +269,25 @@ class FileConversationRepository(IConversationRepository):
         limit: int | None = None,
     ) -> list[ConversationSummary]:
         """Search conversation threads by content."""
+        return await asyncio.to_thread(self._search_threads_sync, query, agent_name, agent_type, limit)
+
+    def _search_threads_sync(
+        self,
+        query: str,
+        agent_name: str | None = None,
+        agent_type: str | None = None,
+        limit: int | None = None,
+    ) -> list[ConversationSummary]:
+        """Search conversation threads by content (blocking)."""
         query_lower = query.lower()
         matching_summaries = []
 
         # Get all threads first
-        all_summaries = await self.list_threads(agent_name=agent_name, agent_type=agent_type)
+        all_summaries = self._list_threads_sync(agent_name=agent_name, agent_type=agent_type)
 
         for summary in all_summaries:
             # Load the full thread to search message content
-            thread = await self.load_thread(summary.thread_id)
+            thread = self._load_thread_sync(summary.thread_id)
             if not thread:
                 continue
 
@@ -1,5 +1,7 @@
 """Observability and tracing setup for the agent framework."""
 
+from functools import cache
+
 
 def setup_observability(
     enable_sensitive_data: bool = False,
@@ -22,3 +24,20 @@ def setup_observability(
 
     if enable_sensitive_data:
         print("⚠️  Warning: Sensitive data tracing is enabled")
+
+
+@cache
+def ensure_observability() -> None:
+    """Initialize observability from settings once per process.
+
+    Called lazily on first agent initialization instead of at package import,
+    so entrypoints that only need configuration don't pay for tracing setup.
+    """
+    from microsoft_agent_framework.config import settings
+
+    if settings.observability.enable_otel:
+        setup_observability(
+            enable_sensitive_data=settings.observability.enable_sensitive_data,
+            otlp_endpoint=settings.observability.otlp_endpoint,
+            applicationinsights_connection_string=settings.observability.applicationinsights_connection_string,
+        )
@@ -225,6 +225,20 @@ class TestResearchAgent:
         assert research_agent.config == agent_config
         assert not research_agent._is_initialized
 
+    def test_retry_policy_follows_settings_reload(self, agent_config, monkeypatch):
+        """Test that agents created after a settings reload use the reloaded retry limits."""
+        from microsoft_agent_framework.config import settings
+
+        monkeypatch.setenv("RESILIENCE_AGENT_MAX_ATTEMPTS", "7")
+        settings.reload()
+        try:
+            assert ResearchAgent(agent_config)._retry_policy.max_attempts == 7
+        finally:
+            monkeypatch.delenv("RESILIENCE_AGENT_MAX_ATTEMPTS")
+            settings.reload()
+
+        assert ResearchAgent(agent_config)._retry_policy.max_attempts == settings.resilience.agent_max_attempts
+
     @pytest.mark.asyncio
     async def test_initialize_success(self, research_agent):
         """Test successful initialization."""
@@ -371,6 +385,24 @@ class TestWriterAgent:
                 assert "Writer agent execution failed" in str(exc_info.value)
                 assert exc_info.value.agent_name == writer_agent.name
 
+    @pytest.mark.asyncio
+    async def test_run_resumes_service_thread(self, writer_agent):
+        """Test that a conversation's service thread is resumed and recorded."""
+        thread = ConversationThread(agent_name="Test Writer Agent", agent_type="writer")
+        thread.metadata["service_thread_id"] = "thread_abc"
+
+        with patch.object(writer_agent, "initialize", new_callable=AsyncMock):
+            with patch.object(writer_agent, "_azure_agent") as mock_azure_agent:
+                native_thread = Mock(service_thread_id="thread_abc")
+                mock_azure_agent.get_new_thread.return_value = native_thread
+                mock_azure_agent.run = AsyncMock(return_value=Mock())
+
+                await writer_agent.run("Write an email", thread=thread)
+
+                mock_azure_agent.get_new_thread.assert_called_once_with(service_thread_id="thread_abc")
+                mock_azure_agent.run.assert_called_once_with("Write an email", thread=native_thread)
+                assert thread.metadata["service_thread_id"] == "thread_abc"
+
 
 class TestAgentIntegration:
     """Integration tests for agent interactions."""
@@ -441,3 +473,20 @@ class TestAgentIntegration:
         delegation_func = supervisor._create_research_delegation_function()
         result = await delegation_func("Test query")
         assert "Research failed" in result
+
+    def test_research_agents_build_separate_search_tools(self, monkeypatch):
+        """Test that research agents never share an MCP tool, whose connection belongs to one agent."""
+        from microsoft_agent_framework.application.factories.agent_factory import AzureAgentFactory
+        from microsoft_agent_framework.config import settings
+
+        monkeypatch.setattr(settings.tools, "brave_api_key", "test-key")
+        factory = AzureAgentFactory()
+        config = AgentConfig(name="Research", agent_type=AgentType.RESEARCH, instructions="Test")
+
+        with patch("microsoft_agent_framework.application.agents.research_agent.MCPStdioTool") as tool_class:
+            tool_class.side_effect = lambda **kwargs: Mock()
+            first = factory.create_agent(AgentType.RESEARCH.value, config)._create_tools()
+            second = factory.create_agent(AgentType.RESEARCH.value, config)._create_tools()
+
+        assert len(first) == len(second) == 1
+        assert first[0] is not second[0]
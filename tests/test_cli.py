@@ -0,0 +1,95 @@
+"""Unit tests for the CLI entry point."""
+
+import sys
+
+import typer
+
+from microsoft_agent_framework.__main__ import COMMANDS, main
+
+
+class TestMain:
+    """Test cases for the console entry point."""
+
+    def test_fast_help_lists_every_command(self):
+        """Test that the fast help stays in sync with the commands registered on the Typer app."""
+        from microsoft_agent_framework.cli import create_app
+
+        registered = typer.main.get_command(create_app()).commands
+        assert [name for name, _ in COMMANDS] == list(registered)
+        assert {name: registered[name].help for name, _ in COMMANDS} == dict(COMMANDS)
+
+    def test_help_does_not_import_typer_app(self, capsys, monkeypatch):
+        """Test that top-level help is answered without importing the CLI module."""
+        monkeypatch.delitem(sys.modules, "microsoft_agent_framework.cli", raising=False)
+
+        main(["--help"])
+
+        assert "chat-with-thread" in capsys.readouterr().out
+        assert "microsoft_agent_framework.cli" not in sys.modules
+
+    def test_create_app_registers_only_invoked_command(self):
+        """Test that a known command name registers just that command, still invoked by name."""
+        from microsoft_agent_framework.cli import create_app
+
+        group = typer.main.get_command(create_app("session"))
+
+        assert list(group.commands) == ["session"]
+        assert list(typer.main.get_command(create_app("unknown")).commands) == [name for name, _ in COMMANDS]
+
+    def test_version(self, capsys):
+        """Test the version flag."""
+        main(["--version"])
+        assert capsys.readouterr().out.startswith("microsoft_agent_framework ")
+
+    def test_session_command_skips_settings_import(self, tmp_path):
+        """Test that session-only commands do not import the settings stack."""
+        import os
+        import subprocess
+        from pathlib import Path
+
+        import microsoft_agent_framework
+
+        src_dir = str(Path(microsoft_agent_framework.__file__).parents[1])
+        env = {**os.environ, "PYTHONPATH": src_dir}
+        code = (
+            "import sys\n"
+            "from microsoft_agent_framework.__main__ import main\n"
+            "main(['session'])\n"
+            "assert 'microsoft_agent_framework.config' not in sys.modules\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestAsyncCommand:
+    """Test cases for the async command wrapper."""
+
+    def test_abort_passes_through(self):
+        """Test that Ctrl-C at a prompt still surfaces as typer.Abort."""
+        import pytest
+
+        from microsoft_agent_framework.cli import _async_command
+
+        @_async_command
+        async def command() -> None:
+            raise typer.Abort()
+
+        with pytest.raises(typer.Abort):
+            command()
+
+    def test_error_becomes_exit_code_one(self, capsys):
+        """Test that other errors are printed and exit with code 1."""
+        import pytest
+
+        from microsoft_agent_framework.cli import _async_command
+
+        @_async_command
+        async def command() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(typer.Exit) as exc_info:
+            command()
+
+        assert exc_info.value.exit_code == 1
+        assert "boom" in capsys.readouterr().out
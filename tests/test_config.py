@@ -0,0 +1,97 @@
+"""Unit tests for configuration loading."""
+
+import os
+from unittest.mock import patch
+
+from microsoft_agent_framework import config
+from microsoft_agent_framework.config import AzureOpenAIConfig, Settings
+
+
+class TestSettings:
+    """Test cases for the centralized settings."""
+
+    def test_env_file_parsed_once_for_all_sections(self, tmp_path, monkeypatch):
+        """Test that every config section is fed from a single parse of ``.env``."""
+        (tmp_path / ".env").write_text(
+            "AZURE_OPENAI_API_KEY=from-dotenv\nRESILIENCE_DEFAULT_MAX_ATTEMPTS=7\nLOG_LEVEL=DEBUG\n",
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("RESILIENCE_DEFAULT_MAX_ATTEMPTS", raising=False)
+        monkeypatch.delenv("LOG_LEVEL", raising=False)
+        settings = Settings()
+        settings.reload()
+
+        with patch.object(config, "dotenv_values", wraps=config.dotenv_values) as read_env_file:
+            assert settings.azure.api_key == "from-dotenv"
+            assert settings.resilience.default_max_attempts == 7
+            assert settings.app.log_level == "DEBUG"
+            assert settings.observability.enable_otel is True
+            assert settings.tools.brave_api_key is None
+            assert settings.azure_ai_foundry.model_deployment_name
+
+        assert read_env_file.call_count == 1
+
+    def test_environment_overrides_env_file_after_reload(self, tmp_path, monkeypatch):
+        """Test that environment variables take precedence and reload picks up changes."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("AZURE_OPENAI_API_KEY=from-dotenv\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "from-env")
+        settings = Settings()
+        settings.reload()
+
+        assert settings.azure.api_key == "from-env"
+
+        env_file.write_text("AZURE_OPENAI_API_KEY=updated\n", encoding="utf-8")
+        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+        settings.reload()
+
+        assert settings.azure.api_key == "updated"
+
+    def test_explicit_env_file_none_skips_dotenv(self, tmp_path, monkeypatch):
+        """Test that ``_env_file=None`` disables the default ``.env`` file."""
+        (tmp_path / ".env").write_text("AZURE_OPENAI_API_KEY=from-dotenv\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("AZURE_OPENAI_API_KEY", raising=False)
+
+        assert AzureOpenAIConfig().api_key == "from-dotenv"
+        assert AzureOpenAIConfig(_env_file=None).api_key is None
+
+    def test_sections_built_on_first_access(self):
+        """Test that sections are built only when read and cached until reload."""
+        settings = Settings()
+
+        assert "resilience" not in vars(settings)
+        resilience = settings.resilience
+        assert settings.resilience is resilience
+        assert "azure" not in vars(settings)
+
+        settings.reload()
+
+        assert settings.resilience is not resilience
+
+    def test_foundry_config_does_not_overwrite_environment(self, monkeypatch):
+        """Test that the Foundry config only fills in missing Azure AI variables."""
+        monkeypatch.setenv("PROJECT_ENDPOINT", "https://project.example.com")
+        monkeypatch.setenv("AZURE_AI_PROJECT_ENDPOINT", "https://existing.example.com")
+        monkeypatch.delenv("AZURE_SUBSCRIPTION_ID", raising=False)
+        settings = Settings()
+
+        assert settings.azure_ai_foundry.is_configured
+
+        assert os.environ["AZURE_AI_PROJECT_ENDPOINT"] == "https://existing.example.com"
+        assert "AZURE_SUBSCRIPTION_ID" not in os.environ
+
+    def test_derived_flags_follow_reload(self, monkeypatch):
+        """Test that cached configuration flags are recomputed for reloaded sections."""
+        monkeypatch.setenv("ENVIRONMENT", "production")
+        settings = Settings()
+
+        assert settings.app.is_production and not settings.app.is_development
+
+        monkeypatch.setenv("ENVIRONMENT", "development")
+        settings.reload()
+
+        assert settings.app.is_development and not settings.app.is_production
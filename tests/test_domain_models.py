@@ -44,6 +44,15 @@ class TestMessage:
 
         assert message.timestamp == custom_time
 
+    def test_message_defaults(self):
+        """Test that default metadata is not shared and explicit None is still normalized."""
+        first = Message(MessageRole.USER, "a")
+        second = Message(MessageRole.USER, "b", timestamp=None, metadata=None)
+
+        assert first.metadata == {} and first.metadata is not second.metadata
+        assert isinstance(second.timestamp, datetime)
+        assert second.metadata == {}
+
     def test_message_immutability(self):
         """Test that Message is immutable (frozen dataclass)."""
         message = Message(role=MessageRole.USER, content="Test")
@@ -362,6 +371,16 @@ class TestEnums:
         all_statuses = list(AgentStatus)
         assert len(all_statuses) == 4
 
+    def test_enums_compare_equal_to_values(self):
+        """Test that enum members are usable wherever their string value is expected."""
+        assert AgentType.WRITER == "writer"
+        assert MessageRole("user") is MessageRole.USER
+        assert {AgentStatus.ERROR: 1}["error"] == 1
+
+        thread = ConversationThread(agent_name="Writer", agent_type=AgentType.WRITER)
+        assert type(thread.agent_type) is str
+        assert thread.agent_type == "writer"
+
 
 class TestThreadMetadata:
     """Test cases for ThreadMetadata dataclass."""
@@ -0,0 +1,34 @@
+"""Unit tests for domain utilities."""
+
+import pytest
+
+from microsoft_agent_framework.domain.utils import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted once full."""
+        cache: LRUCache[str, int] = LRUCache(2)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache.get("a") == 1  # "a" becomes most recently used
+
+        cache["c"] = 3
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_get_missing_returns_default(self):
+        """Test get with a missing key."""
+        cache: LRUCache[str, int] = LRUCache(1)
+        assert cache.get("missing") is None
+        assert cache.get("missing", 0) == 0
+
+    def test_invalid_maxsize(self):
+        """Test that a non-positive maxsize is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(0)
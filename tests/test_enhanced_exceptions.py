@@ -372,6 +372,44 @@ class TestExceptionSerialization:
         assert deserialized["error_type"] == "RateLimitError"
         assert deserialized["retry_after"] == 60.0
 
+    def test_exception_to_json(self):
+        """Test that to_json encodes the same fields as to_dict."""
+        import json
+        from datetime import UTC, datetime
+
+        error = ToolTimeoutError(
+            "Tool timed out", timeout_duration=5.0, details={"at": datetime(2024, 1, 1, tzinfo=UTC)}
+        )
+
+        payload = json.loads(error.to_json())
+
+        assert payload["error_type"] == "ToolTimeoutError"
+        assert payload["details"]["timeout_duration"] == 5.0
+        assert payload["details"]["at"].startswith("2024-01-01")
+        assert payload["timestamp"] == error.timestamp
+
+    def test_exception_pickle_round_trip(self):
+        """Test that slot attributes survive pickling."""
+        import pickle
+
+        error = ToolExecutionError("Tool failed", tool_name="search", execution_time=1.5, error_code="TOOL_001")
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is ToolExecutionError
+        assert str(restored) == "Tool failed"
+        assert restored.to_dict() == error.to_dict()
+        assert restored.tool_name == "search"
+
+    def test_details_allocated_on_demand(self):
+        """Test that errors without details carry no per-instance dicts until asked."""
+        error = AgentError("Agent failed")
+
+        assert not hasattr(error, "__dict__") or not error.__dict__
+        assert error.details == {}
+        error.details["attempt"] = 2
+        assert error.to_dict()["details"] == {"attempt": 2}
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
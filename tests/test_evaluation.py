@@ -2,9 +2,10 @@
 
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from azure.core.exceptions import ResourceNotFoundError
 
 from microsoft_agent_framework.application.evaluation_service.eval import (
     call_agent,
@@ -202,6 +203,7 @@ class TestEvaluateResponsesCloud:
             # Mock client and responses
             mock_client = Mock()
             mock_client_class.return_value = mock_client
+            mock_client.datasets.get.side_effect = ResourceNotFoundError("Dataset version not found")
 
             # Mock dataset upload
             mock_dataset = Mock()
@@ -231,6 +233,7 @@ class TestEvaluateResponsesCloud:
         with patch.dict("os.environ", env_vars):
             mock_client = Mock()
             mock_client_class.return_value = mock_client
+            mock_client.datasets.get.side_effect = ResourceNotFoundError("Dataset version not found")
             mock_client.datasets.upload_file.side_effect = Exception("Upload failed")
 
             result = evaluate_responses_cloud(mock_output_file)
@@ -250,6 +253,7 @@ class TestEvaluateResponsesCloud:
         with patch.dict("os.environ", env_vars):
             mock_client = Mock()
             mock_client_class.return_value = mock_client
+            mock_client.datasets.get.side_effect = ResourceNotFoundError("Dataset version not found")
 
             # Mock successful dataset upload
             mock_dataset = Mock()
@@ -263,6 +267,27 @@ class TestEvaluateResponsesCloud:
 
             assert result is None
 
+    @patch("microsoft_agent_framework.application.evaluation_service.eval.AIProjectClient")
+    def test_evaluate_responses_cloud_reuses_existing_dataset(self, mock_client_class, mock_output_file):
+        """Test that an unchanged results file reuses the dataset version already uploaded."""
+        env_vars = {
+            "PROJECT_ENDPOINT": "https://test.endpoint.com",
+            "AZURE_OPENAI_RESPONSES_DEPLOYMENT_NAME": "test-deployment",
+            "AZURE_OPENAI_ENDPOINT": "https://openai.endpoint.com",
+            "AZURE_OPENAI_API_KEY": "test-key",
+        }
+
+        with patch.dict("os.environ", env_vars):
+            mock_client = Mock()
+            mock_client_class.return_value = mock_client
+            mock_client.datasets.get.return_value.id = "existing-dataset-id"
+
+            evaluate_responses_cloud(mock_output_file)
+
+            mock_client.datasets.upload_file.assert_not_called()
+            evaluation = mock_client.evaluations.create.call_args.args[0]
+            assert evaluation.data.id == "existing-dataset-id"
+
 
 class TestRunEvaluation:
     """Test cases for the run_evaluation function."""
@@ -277,32 +302,31 @@ class TestRunEvaluation:
                 f.write(json.dumps(item) + "\n")
         return input_file
 
-    @pytest.mark.asyncio
-    async def test_run_evaluation_success(self, tmp_path, mock_input_file):
+    def test_run_evaluation_success(self, tmp_path, mock_input_file):
         """Test successful evaluation run."""
         output_file = tmp_path / "evaluation_results.jsonl"
 
-        with patch("microsoft_agent_framework.application.evaluation_service.eval.generate_responses"):
+        with patch(
+            "microsoft_agent_framework.application.evaluation_service.eval.generate_responses",
+            new_callable=AsyncMock,
+        ) as mock_generate:
             with patch(
                 "microsoft_agent_framework.application.evaluation_service.eval.evaluate_responses_cloud"
             ) as mock_evaluate:
-                with patch("asyncio.get_event_loop") as mock_loop:
-                    mock_async_loop = Mock()
-                    mock_loop.return_value = mock_async_loop
-                    mock_async_loop.run_until_complete.return_value = output_file
+                mock_generate.return_value = output_file
 
-                    mock_evaluation_result = Mock()
-                    mock_evaluate.return_value = mock_evaluation_result
+                mock_evaluation_result = Mock()
+                mock_evaluate.return_value = mock_evaluation_result
 
-                    result = run_evaluation(
-                        input_file=str(mock_input_file),
-                        output_file=str(output_file),
-                        skip_generation=False,
-                    )
+                result = run_evaluation(
+                    input_file=str(mock_input_file),
+                    output_file=str(output_file),
+                    skip_generation=False,
+                )
 
-                    assert result == mock_evaluation_result
-                    mock_async_loop.run_until_complete.assert_called_once()
-                    mock_evaluate.assert_called_once_with(output_file)
+                assert result == mock_evaluation_result
+                mock_generate.assert_awaited_once()
+                mock_evaluate.assert_called_once_with(output_file)
 
     def test_run_evaluation_skip_generation(self, tmp_path, mock_input_file):
         """Test evaluation run with skipped generation."""
@@ -326,6 +350,24 @@ class TestRunEvaluation:
             assert result == mock_evaluation_result
             mock_evaluate.assert_called_once_with(Path(output_file))
 
+    def test_run_evaluation_closes_shared_clients(self, tmp_path, mock_input_file):
+        """Test that the shared Azure clients are closed even when generation fails."""
+        with (
+            patch(
+                "microsoft_agent_framework.application.evaluation_service.eval.generate_responses",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("generation failed"),
+            ),
+            patch(
+                "microsoft_agent_framework.application.evaluation_service.eval.close_shared_clients",
+                new_callable=AsyncMock,
+            ) as mock_close,
+        ):
+            with pytest.raises(RuntimeError):
+                run_evaluation(input_file=str(mock_input_file), output_file=str(tmp_path / "out.jsonl"))
+
+        mock_close.assert_awaited_once()
+
     def test_run_evaluation_file_not_found(self):
         """Test evaluation run with non-existent input file."""
         with pytest.raises(FileNotFoundError) as exc_info:
@@ -333,8 +375,7 @@ class TestRunEvaluation:
 
         assert "Input file not found" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    async def test_run_evaluation_with_project_root_fallback(self, tmp_path):
+    def test_run_evaluation_with_project_root_fallback(self, tmp_path):
         """Test evaluation run with project root fallback for file paths."""
         # Create files in a subdirectory to simulate project structure
         data_dir = tmp_path / "data"
@@ -350,25 +391,25 @@ class TestRunEvaluation:
             # Mock current working directory to be our test path
             mock_cwd.return_value = tmp_path
 
-            with patch("microsoft_agent_framework.application.evaluation_service.eval.generate_responses"):
+            with patch(
+                "microsoft_agent_framework.application.evaluation_service.eval.generate_responses",
+                new_callable=AsyncMock,
+            ) as mock_generate:
                 with patch(
                     "microsoft_agent_framework.application.evaluation_service.eval.evaluate_responses_cloud"
                 ) as mock_evaluate:
-                    with patch("asyncio.get_event_loop") as mock_loop:
-                        mock_async_loop = Mock()
-                        mock_loop.return_value = mock_async_loop
-                        mock_async_loop.run_until_complete.return_value = tmp_path / "data" / "evaluation_results.jsonl"
+                    mock_generate.return_value = tmp_path / "data" / "evaluation_results.jsonl"
 
-                        mock_evaluation_result = Mock()
-                        mock_evaluate.return_value = mock_evaluation_result
+                    mock_evaluation_result = Mock()
+                    mock_evaluate.return_value = mock_evaluation_result
 
-                        # Use relative path that doesn't exist initially
-                        result = run_evaluation(
-                            input_file="data/qr_data.jsonl",
-                            output_file="data/evaluation_results.jsonl",
-                        )
+                    # Use relative path that doesn't exist initially
+                    result = run_evaluation(
+                        input_file="data/qr_data.jsonl",
+                        output_file="data/evaluation_results.jsonl",
+                    )
 
-                        assert result == mock_evaluation_result
+                    assert result == mock_evaluation_result
 
 
 class TestEvaluationIntegration:
@@ -404,6 +445,40 @@ class TestEvaluationIntegration:
             assert results[0]["response"] == "Machine learning is a method of AI"
             assert results[0]["ground_truth"] == "ML is a subset of AI"
 
+    @pytest.mark.asyncio
+    async def test_generate_responses_bounds_reorder_buffer(self, tmp_path, monkeypatch):
+        """Test that a slow first query keeps order and stops workers running far ahead."""
+        import asyncio
+
+        input_file = tmp_path / "test_data.jsonl"
+        input_file.write_text("".join(json.dumps({"query": f"q{i}", "response": "r"}) + "\n" for i in range(20)))
+        output_file = tmp_path / "results.jsonl"
+        monkeypatch.setenv("EVAL_CONCURRENCY", "2")
+
+        release_first = asyncio.Event()
+        started: list[str] = []
+
+        async def fake_call_agent(query: str) -> str:
+            started.append(query)
+            if query == "q0":
+                await release_first.wait()
+            return query.upper()
+
+        async def release_later() -> None:
+            for _ in range(50):
+                await asyncio.sleep(0)
+            # With a window of 2 * concurrency, only rows q0..q3 may have started
+            assert len(started) == 4
+            release_first.set()
+
+        with patch(
+            "microsoft_agent_framework.application.evaluation_service.eval.call_agent", side_effect=fake_call_agent
+        ):
+            await asyncio.gather(generate_responses(input_file, output_file), release_later())
+
+        with open(output_file) as f:
+            assert [json.loads(line)["response"] for line in f] == [f"Q{i}" for i in range(20)]
+
     def test_evaluation_error_handling(self):
         """Test error handling in evaluation functions."""
         # Test with invalid path objects
@@ -51,6 +51,17 @@ class TestRetryPolicy:
         assert not policy.should_retry(ValueError("Invalid value"), 0)
         assert not policy.should_retry(TypeError("Type error"), 1)
 
+    def test_should_retry_decision_cached_per_type(self):
+        """Test that repeated decisions for a type give the same answer as the first."""
+        policy = RetryPolicy(max_attempts=3)
+
+        for _ in range(2):
+            assert policy.should_retry(RateLimitError("Rate limited"), 0)
+            assert not policy.should_retry(AuthenticationError("Auth failed"), 0)
+            assert not policy.should_retry(KeyError("missing"), 0)
+
+        assert policy._decisions == {RateLimitError: True, AuthenticationError: False, KeyError: False}
+
     def test_calculate_delay_fixed_strategy(self):
         """Test delay calculation with fixed strategy."""
         policy = RetryPolicy(base_delay=2.0, strategy=RetryStrategy.FIXED, jitter=False)
@@ -1,5 +1,7 @@
 """Unit tests for application services."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -9,7 +11,9 @@ from microsoft_agent_framework.application.services import (
     ConversationManager,
     ConversationService,
     ConversationSession,
+    get_session,
 )
+from microsoft_agent_framework.config import settings
 from microsoft_agent_framework.domain.exceptions import (
     AgentNotFoundError,
 )
@@ -51,6 +55,18 @@ class TestAgentService:
         await agent_service.initialize()
         assert agent_service.is_initialized
 
+    def test_retry_settings_follow_reload(self, monkeypatch):
+        """Test that services built after a settings reload use the reloaded retry limits."""
+        monkeypatch.setenv("RESILIENCE_AGENT_MAX_ATTEMPTS", "7")
+        settings.reload()
+        try:
+            assert AgentService()._get_retry_policy().max_attempts == 7
+        finally:
+            monkeypatch.delenv("RESILIENCE_AGENT_MAX_ATTEMPTS")
+            settings.reload()
+
+        assert AgentService()._get_retry_policy().max_attempts == settings.resilience.agent_max_attempts
+
     @pytest.mark.asyncio
     async def test_cleanup(self, agent_service, mock_agent):
         """Test service cleanup."""
@@ -62,6 +78,19 @@ class TestAgentService:
         mock_agent.cleanup.assert_called_once()
         assert not agent_service.is_initialized
 
+    @pytest.mark.asyncio
+    async def test_cleanup_continues_after_agent_failure(self, agent_service, mock_agent):
+        """Test that one failing agent does not stop the others from being cleaned up."""
+        failing_agent = AsyncMock()
+        failing_agent.cleanup.side_effect = RuntimeError("close failed")
+        agent_service.register_agent("failing", failing_agent)
+        agent_service.register_agent("test-1", mock_agent)
+
+        await agent_service.cleanup()
+
+        mock_agent.cleanup.assert_called_once()
+        assert agent_service._agents == {}
+
     def test_register_agent(self, agent_service, mock_agent):
         """Test registering an agent."""
         agent_service.register_agent("test-1", mock_agent)
@@ -131,14 +160,48 @@ class TestAgentService:
             assert result.status == AgentStatus.ERROR.value
             assert "timed out after 1 seconds" in result.error
 
+    @pytest.mark.asyncio
+    async def test_execute_agent_without_retry_failure(self, agent_service, mock_agent):
+        """Test that a failing single-attempt execution returns an error response."""
+        mock_agent.run.side_effect = RuntimeError("boom")
+        agent_service.register_agent("test-1", mock_agent)
+
+        result = await agent_service.execute_agent("test-1", "Test message", enable_retry=False)
+
+        assert result.status == AgentStatus.ERROR.value
+        assert result.error == "Agent 'test-1' execution failed: boom"
+        mock_agent.run.assert_called_once_with("Test message")
+
+    @pytest.mark.asyncio
+    async def test_execute_agent_bounded_concurrency(self, agent_service, mock_agent):
+        """Test that concurrent executions never exceed agent_max_concurrency."""
+        running = 0
+        peak = 0
+
+        async def run(message):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        mock_agent.run = run
+        agent_service.register_agent("test-1", mock_agent)
+
+        with patch.object(settings.resilience, "agent_max_concurrency", 2):
+            await asyncio.gather(*(agent_service.execute_agent("test-1", "Test message") for _ in range(6)))
+
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_create_conversation_session(self, agent_service):
         """Test creating a conversation session."""
         session_id = await agent_service.create_conversation_session()
 
         assert len(session_id) > 0
-        # Session ID should be a valid UUID string format
-        assert "-" in session_id
+        # Session ID should be a UUID in 32-character hex form
+        assert len(session_id) == 32
+        int(session_id, 16)
 
 
 class TestConversationService:
@@ -207,6 +270,52 @@ class TestConversationService:
         assert result == sample_thread
         mock_repository.load_thread.assert_called_once_with("test-123")
 
+    @pytest.mark.asyncio
+    async def test_load_thread_served_from_cache(self, conversation_service, mock_repository, sample_thread):
+        """Test that saved threads are loaded without a repository round-trip."""
+        await conversation_service.save_thread(sample_thread)
+
+        result = await conversation_service.load_thread(sample_thread.thread_id)
+
+        assert result == sample_thread
+        mock_repository.load_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unsaved_changes_stay_out_of_cache(self, conversation_service, mock_repository, sample_thread):
+        """Test that changes to a loaded thread are not seen by later loads until it is saved."""
+        await conversation_service.save_thread(sample_thread)
+        sample_thread.add_message(Message(role=MessageRole.USER, content="Not saved"))
+
+        loaded = await conversation_service.load_thread(sample_thread.thread_id)
+        loaded.add_message(Message(role=MessageRole.USER, content="Also not saved"))
+
+        reloaded = await conversation_service.load_thread(sample_thread.thread_id)
+        assert [m.content for m in reloaded.messages] == ["Hello"]
+        mock_repository.load_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queue_save_coalesces_writes(self, conversation_service, mock_repository, sample_thread):
+        """Test that queued saves of one thread are written once in the background."""
+        conversation_service.queue_save(sample_thread)
+        conversation_service.queue_save(sample_thread)
+
+        await conversation_service.flush_saves()
+
+        mock_repository.save_thread.assert_called_once_with(sample_thread)
+        assert await conversation_service.load_thread(sample_thread.thread_id) == sample_thread
+
+    @pytest.mark.asyncio
+    async def test_delete_thread_evicts_cache(self, conversation_service, mock_repository, sample_thread):
+        """Test that deleting a thread drops it from the cache."""
+        await conversation_service.save_thread(sample_thread)
+        await conversation_service.delete_thread(sample_thread.thread_id)
+        mock_repository.load_thread.return_value = None
+
+        result = await conversation_service.load_thread(sample_thread.thread_id)
+
+        assert result is None
+        mock_repository.load_thread.assert_called_once_with(sample_thread.thread_id)
+
     @pytest.mark.asyncio
     async def test_delete_thread(self, conversation_service, mock_repository):
         """Test deleting a conversation thread."""
@@ -234,6 +343,114 @@ class TestConversationService:
         assert result == expected_summaries
         mock_repository.list_threads.assert_called_once_with(agent_name=None, agent_type=None, limit=None, offset=0)
 
+    @pytest.mark.asyncio
+    async def test_get_thread_summary_skips_full_load(self, conversation_service, mock_repository, sample_thread):
+        """Test that summaries come from the cached thread or the repository, never a full load."""
+        mock_repository.get_thread_summary.return_value = None
+        assert await conversation_service.get_thread_summary("missing") is None
+        mock_repository.get_thread_summary.assert_awaited_once_with("missing")
+
+        await conversation_service.save_thread(sample_thread)
+        summary = await conversation_service.get_thread_summary(sample_thread.thread_id)
+
+        assert summary.message_count == 1
+        assert summary.last_message_preview == "Hello"
+        mock_repository.load_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_file_repository_get_thread_summary(self, sample_thread, tmp_path):
+        """Test reading a single thread summary from the file repository."""
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path))
+        await repository.save_thread(sample_thread)
+
+        summary = await repository.get_thread_summary(sample_thread.thread_id)
+
+        assert summary.thread_id == sample_thread.thread_id
+        assert summary.message_count == 1
+        assert await repository.get_thread_summary("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_file_repository_list_reads_only_changed_threads(self, sample_thread, tmp_path):
+        """Test that listings reuse the summary index and re-read only changed thread files."""
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path))
+        other_thread = ConversationThread(agent_name="Other Agent", agent_type="writer")
+        await repository.save_thread(sample_thread)
+        await repository.save_thread(other_thread)
+        assert len(await repository.list_threads()) == 2
+
+        with patch.object(FileConversationRepository, "_index_entry", wraps=repository._index_entry) as index_entry:
+            # A fresh repository (e.g. the next CLI run) loads the persisted index
+            reloaded = FileConversationRepository(str(tmp_path))
+            assert len(await reloaded.list_threads(agent_type="writer")) == 1
+            assert index_entry.call_count == 0
+
+            sample_thread.add_message(Message(role=MessageRole.ASSISTANT, content="Hi"))
+            await reloaded.save_thread(sample_thread)
+            (summary,) = await reloaded.list_threads(agent_type="supervisor")
+            assert summary.message_count == 2
+            assert index_entry.call_count == 1
+
+        await reloaded.delete_thread(other_thread.thread_id)
+        assert [s.thread_id for s in await reloaded.list_threads()] == [sample_thread.thread_id]
+
+    @pytest.mark.asyncio
+    async def test_file_repository_paginates_readable_threads(self, tmp_path):
+        """Test that unreadable thread files do not shorten a page of results."""
+        import os
+
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path))
+        threads = [ConversationThread(agent_name=f"Agent {i}", agent_type="writer") for i in range(3)]
+        for thread in threads:
+            await repository.save_thread(thread)
+        # Parses as a thread file but cannot be turned into a summary
+        (tmp_path / "corrupt.json").write_text(
+            json.dumps(
+                {
+                    "thread_id": "corrupt",
+                    "agent_name": "Bad",
+                    "agent_type": "writer",
+                    "created_at": "?",
+                    "updated_at": "?",
+                }
+            )
+        )
+        # Oldest to newest: threads[0], threads[1], threads[2], then the corrupt file
+        for i, path in enumerate([*(tmp_path / f"{t.thread_id}.json" for t in threads), tmp_path / "corrupt.json"]):
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+
+        first_page = await repository.list_threads(limit=2)
+        second_page = await repository.list_threads(limit=2, offset=2)
+
+        assert [s.thread_id for s in first_page] == [threads[2].thread_id, threads[1].thread_id]
+        assert [s.thread_id for s in second_page] == [threads[0].thread_id]
+
+    @pytest.mark.asyncio
+    async def test_file_repository_concurrent_list_and_search(self, sample_thread, tmp_path):
+        """Test concurrent list and search calls against the file repository."""
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path))
+        await repository.save_thread(sample_thread)
+        await repository.save_thread(ConversationThread(agent_name="Other Agent", agent_type="writer"))
+
+        listed, filtered, found, missing = await asyncio.gather(
+            repository.list_threads(),
+            repository.list_threads(agent_type="supervisor"),
+            repository.search_threads("hello"),
+            repository.search_threads("absent"),
+        )
+
+        assert len(listed) == 2
+        assert [s.thread_id for s in filtered] == [sample_thread.thread_id]
+        assert [s.thread_id for s in found] == [sample_thread.thread_id]
+        assert missing == []
+
 
 class TestConversationManager:
     """Test cases for ConversationManager."""
@@ -251,7 +468,11 @@ class TestConversationManager:
     @pytest.fixture
     def mock_conversation_service(self):
         """Create a mock conversation service."""
-        return AsyncMock()
+        service = AsyncMock()
+        # queue_save and peek_thread are synchronous
+        service.queue_save = Mock()
+        service.peek_thread = Mock(return_value=None)
+        return service
 
     def test_conversation_manager_creation(self, conversation_manager):
         """Test conversation manager creation."""
@@ -282,6 +503,68 @@ class TestConversationManager:
             assert isinstance(result, ConversationThread)
             assert result.title == "Test Chat"
 
+    @pytest.mark.asyncio
+    async def test_chat_reuses_current_thread(self, tmp_path):
+        """Test that consecutive chats reuse the current thread from the service cache."""
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path / "threads"))
+        service = ConversationService(repository)
+        conversation_manager = ConversationManager(service, ConversationSession(str(tmp_path / "session")))
+        mock_agent = Mock()
+        mock_agent.config.agent_type = "supervisor"
+        mock_agent.get_new_thread.side_effect = lambda: ConversationThread(
+            agent_name="Test Agent", agent_type="supervisor"
+        )
+        mock_agent.run = AsyncMock()
+
+        with patch.object(repository, "load_thread", wraps=repository.load_thread) as load_thread:
+            _, first = await conversation_manager.chat(mock_agent, "Hello")
+            _, second = await conversation_manager.chat(mock_agent, "Again")
+
+        assert second.thread_id == first.thread_id
+        load_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chat_after_delete_starts_new_thread(self, tmp_path):
+        """Test that a deleted current thread is neither resumed nor written back."""
+        from microsoft_agent_framework.infrastructure.repositories import FileConversationRepository
+
+        repository = FileConversationRepository(str(tmp_path / "threads"))
+        service = ConversationService(repository)
+        conversation_manager = ConversationManager(service, ConversationSession(str(tmp_path / "session")))
+        mock_agent = Mock()
+        mock_agent.config.agent_type = "supervisor"
+        mock_agent.get_new_thread.side_effect = lambda: ConversationThread(
+            agent_name="Test Agent", agent_type="supervisor"
+        )
+        mock_agent.run = AsyncMock()
+
+        _, first = await conversation_manager.chat(mock_agent, "Hello")
+        await service.delete_thread(first.thread_id)
+        _, second = await conversation_manager.chat(mock_agent, "Again")
+        await service.flush_saves()
+
+        assert second.thread_id != first.thread_id
+        assert await repository.load_thread(first.thread_id) is None
+
+    @pytest.mark.asyncio
+    async def test_smart_chat_reuses_agent(self, mock_conversation_service, tmp_path):
+        """Test that smart_chat creates one agent per agent type."""
+        conversation_manager = ConversationManager(mock_conversation_service, ConversationSession(str(tmp_path)))
+        mock_agent = Mock()
+        mock_agent.config.agent_type = "writer"
+        mock_agent.get_new_thread.return_value = ConversationThread(agent_name="Test Agent", agent_type="writer")
+        mock_agent.run = AsyncMock()
+
+        from microsoft_agent_framework.application.factories import agent_factory
+
+        with patch.object(agent_factory, "create_agent", return_value=mock_agent) as mock_create:
+            await conversation_manager.smart_chat("Hello", "writer")
+            await conversation_manager.smart_chat("Again", "writer")
+
+        mock_create.assert_called_once()
+
     def test_get_current_session_info(self, conversation_manager):
         """Test getting current session info."""
         info = conversation_manager.get_current_session_info()
@@ -301,7 +584,7 @@ class TestConversationSession:
     def test_conversation_session_creation(self, conversation_session):
         """Test conversation session creation."""
         assert conversation_session.session_dir.name == "test-session-123"
-        assert conversation_session.current_session_file.exists or not conversation_session.current_session_file.exists
+        assert conversation_session.session_dir.is_dir()
 
     def test_get_current_thread_id_no_session(self, conversation_session):
         """Test getting current thread ID when no session exists."""
@@ -335,6 +618,74 @@ class TestConversationSession:
         assert "threads" in info
         assert info["threads"]["supervisor"] == "thread-123"
 
+    def test_session_persisted_across_instances(self, conversation_session):
+        """Test that a new instance loads previously written session data."""
+        conversation_session.set_current_thread_id("supervisor", "thread-123")
+        reloaded = ConversationSession(str(conversation_session.session_dir))
+        assert reloaded.get_current_thread_id("supervisor") == "thread-123"
+
+    def test_get_session_is_shared(self):
+        """Test that get_session returns one instance per process."""
+        assert get_session() is get_session()
+
+    def test_session_stored_per_agent_type(self, conversation_session):
+        """Test that each agent type's thread ID is kept in its own file."""
+        conversation_session.set_current_thread_id("supervisor", "thread-1")
+        conversation_session.set_current_thread_id("writer", "thread-2")
+        conversation_session.clear_current_thread("supervisor")
+
+        session_dir = conversation_session.session_dir
+        assert sorted(p.name for p in session_dir.iterdir()) == ["writer.thread"]
+        assert (session_dir / "writer.thread").read_text() == "thread-2"
+
+    def test_legacy_session_file_migrated(self, tmp_path):
+        """Test that a current.json file from older versions is split per agent type."""
+        (tmp_path / "current.json").write_text('{"threads": {"supervisor": "thread-1"}}')
+
+        session = ConversationSession(str(tmp_path))
+
+        assert session.get_current_thread_id("supervisor") == "thread-1"
+        assert not (tmp_path / "current.json").exists()
+        assert (tmp_path / "supervisor.thread").read_text() == "thread-1"
+
+    @pytest.mark.asyncio
+    async def test_writes_debounced_in_event_loop(self, conversation_session):
+        """Test that updates inside an event loop are written on aclose."""
+        conversation_session.set_current_thread_id("supervisor", "thread-1")
+        conversation_session.set_current_thread_id("writer", "thread-2")
+        assert not list(conversation_session.session_dir.iterdir())
+
+        await conversation_session.aclose()
+        reloaded = ConversationSession(str(conversation_session.session_dir))
+        assert reloaded.get_session_info()["threads"] == {"supervisor": "thread-1", "writer": "thread-2"}
+
+    @pytest.mark.asyncio
+    async def test_failed_write_kept_pending(self, conversation_session):
+        """Test that a failing background write keeps the change for the next flush."""
+        conversation_session.set_current_thread_id("supervisor", "thread-1")
+
+        with patch.object(conversation_session, "_write", side_effect=OSError("disk full")):
+            await conversation_session.aclose()
+
+        await conversation_session.aclose()
+        reloaded = ConversationSession(str(conversation_session.session_dir))
+        assert reloaded.get_current_thread_id("supervisor") == "thread-1"
+
+    @pytest.mark.asyncio
+    async def test_clear_all_sessions_drops_in_flight_write(self, conversation_session):
+        """Test that a write snapshotted before clear_all_sessions does not recreate the session."""
+        conversation_session.set_current_thread_id("supervisor", "thread-1")
+        # What a background flush hands to its worker thread
+        generation = conversation_session._generation
+        changes = conversation_session._take_changes()
+
+        conversation_session.clear_all_sessions()
+        await asyncio.to_thread(conversation_session._write, changes, generation)
+
+        assert not list(conversation_session.session_dir.glob("*.thread"))
+        reloaded = ConversationSession(str(conversation_session.session_dir))
+        assert reloaded.get_current_thread_id("supervisor") is None
+
 
 # Integration tests
 class TestServiceIntegration: